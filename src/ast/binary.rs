@@ -1,4 +1,5 @@
 use crate::{chunk::OpCode, token::TokenType};
+use crate::values::{HeapValue, LazyIter, RangeIter, ReverseRangeIter, Value};
 
 use super::*;
 
@@ -21,6 +22,103 @@ impl Binary {
     }
 }
 
+// One table mapping (operator, operand type) to its typed opcode, shared by
+// every binary expression instead of a match ladder per type
+fn opcode_for(op: TokenType, typ: &Type) -> Result<OpCode, String> {
+    let opcode = match (op, typ) {
+        (TokenType::Eq, Type::Int) => OpCode::IntEqual,
+        (TokenType::NEq, Type::Int) => OpCode::IntNotEqual,
+        (TokenType::GT, Type::Int) => OpCode::IntGreater,
+        (TokenType::GEq, Type::Int) => OpCode::IntGreaterEqual,
+        (TokenType::LT, Type::Int) => OpCode::IntLess,
+        (TokenType::LEq, Type::Int) => OpCode::IntLessEqual,
+        (TokenType::Plus, Type::Int) => OpCode::IntAdd,
+        (TokenType::Minus, Type::Int) => OpCode::IntSubtract,
+        (TokenType::Star, Type::Int) => OpCode::IntMultiply,
+        (TokenType::Slash, Type::Int) => OpCode::IntDivide,
+        (TokenType::To, Type::Int) => OpCode::To,
+
+        (TokenType::Eq, Type::Float) => OpCode::FloatEqual,
+        (TokenType::NEq, Type::Float) => OpCode::FloatNotEqual,
+        (TokenType::GT, Type::Float) => OpCode::FloatGreater,
+        (TokenType::GEq, Type::Float) => OpCode::FloatGreaterEqual,
+        (TokenType::LT, Type::Float) => OpCode::FloatLess,
+        (TokenType::LEq, Type::Float) => OpCode::FloatLessEqual,
+        (TokenType::Plus, Type::Float) => OpCode::FloatAdd,
+        (TokenType::Minus, Type::Float) => OpCode::FloatSubtract,
+        (TokenType::Star, Type::Float) => OpCode::FloatMultiply,
+        (TokenType::Slash, Type::Float) => OpCode::FloatDivide,
+
+        (TokenType::Eq, Type::Bool) => OpCode::BoolEqual,
+        (TokenType::NEq, Type::Bool) => OpCode::BoolNotEqual,
+
+        (TokenType::Eq, Type::Str | Type::Arr(_)) => OpCode::HeapEqual,
+        (TokenType::NEq, Type::Str | Type::Arr(_)) => OpCode::HeapNotEqual,
+        (TokenType::Plus, Type::Str | Type::Arr(_)) => OpCode::Concat,
+
+        (x, Type::Int | Type::Float | Type::Bool | Type::Str | Type::Arr(_)) => {
+            return Err(format!(
+                "Operator {:?} not supported for type {:?}",
+                x, typ
+            ))
+        },
+        (_, x) => return Err(format!(
+            "Type {:?} not yet supported for binary operation", x
+        )),
+    };
+    Ok(opcode)
+}
+
+// Comparisons between two literals of the same numeric type fold to a Bool literal
+fn fold_comparison<T: PartialOrd>(op: TokenType, l: &T, r: &T) -> Option<Literal> {
+    let value = match op {
+        TokenType::Eq => l == r,
+        TokenType::NEq => l != r,
+        TokenType::GT => l > r,
+        TokenType::GEq => l >= r,
+        TokenType::LT => l < r,
+        TokenType::LEq => l <= r,
+        _ => return None,
+    };
+    Some(Literal::new(Type::Bool, value.to_string()))
+}
+
+// If both operands are numeric literals, evaluate an arithmetic operator at parse time
+// and return the result as a new literal. Returns None when the expression can't be
+// folded, in which case it should be compiled as a normal Binary.
+pub fn fold_binary(left: &dyn Expression, op: TokenType, right: &dyn Expression) -> Option<Literal> {
+    let left = left.downcast_ref::<Literal>()?;
+    let right = right.downcast_ref::<Literal>()?;
+    match (left.get_type().ok()?, right.get_type().ok()?) {
+        (Type::Int, Type::Int) => {
+            let l = left.value().parse::<i64>().ok()?;
+            let r = right.value().parse::<i64>().ok()?;
+            let value = match op {
+                TokenType::Plus => l.checked_add(r)?,
+                TokenType::Minus => l.checked_sub(r)?,
+                TokenType::Star => l.checked_mul(r)?,
+                TokenType::Slash => l.checked_div(r)?,
+                _ => return fold_comparison(op, &l, &r),
+            };
+            Some(Literal::new(Type::Int, value.to_string()))
+        },
+        (Type::Float, Type::Float) => {
+            let l = left.value().parse::<f64>().ok()?;
+            let r = right.value().parse::<f64>().ok()?;
+            let value = match op {
+                TokenType::Plus => l + r,
+                TokenType::Minus => l - r,
+                TokenType::Star => l * r,
+                TokenType::Slash => l / r,
+                _ => return fold_comparison(op, &l, &r),
+            };
+            // format via Debug so the result always re-parses as a float literal
+            Some(Literal::new(Type::Float, format!("{:?}", value)))
+        },
+        _ => None,
+    }
+}
+
 impl Expression for Binary {
     fn get_type(&self) -> Result<Type, String> {
         match self.op {
@@ -55,85 +153,73 @@ impl Expression for Binary {
                 self.op, left_type, right_type
             ));
         }
+        // a range between two Int literals is built once at compile time and
+        // stored as a heap constant; evaluating it is then a single clone of a
+        // two-word iterator instead of two pushes and a To dispatch
+        if self.op == TokenType::To && left_type == Type::Int {
+            if let (Some(l), Some(r)) = (
+                self.left.downcast_ref::<Literal>(),
+                self.right.downcast_ref::<Literal>(),
+            ) {
+                let l = l.value().parse::<i64>().map_err(|e| e.to_string())?;
+                let r = r.value().parse::<i64>().map_err(|e| e.to_string())?;
+                let iter: Box<dyn LazyIter<Value>> = if r >= l {
+                    Box::new(RangeIter::new(l, r))
+                }
+                else {
+                    Box::new(ReverseRangeIter::new(l, r))
+                };
+                return compiler.write_heap_constant(HeapValue::LazyIter(iter));
+            }
+        }
+
+        // 'and' and 'or' short-circuit: the right operand is only evaluated
+        // when the left operand doesn't already decide the result
+        if left_type == Type::Bool && (self.op == TokenType::And || self.op == TokenType::Or) {
+            self.left.compile(compiler)?;
+            if self.op == TokenType::And {
+                let false_jump = compiler.write_jump(OpCode::JumpIfFalse)?;
+                self.right.compile(compiler)?;
+                let end_jump = compiler.write_jump(OpCode::Jump)?;
+                compiler.patch_jump(false_jump)?;
+                compiler.write_opcode(OpCode::False);
+                compiler.patch_jump(end_jump)?;
+            }
+            else {
+                let rhs_jump = compiler.write_jump(OpCode::JumpIfFalse)?;
+                compiler.write_opcode(OpCode::True);
+                let end_jump = compiler.write_jump(OpCode::Jump)?;
+                compiler.patch_jump(rhs_jump)?;
+                self.right.compile(compiler)?;
+                compiler.patch_jump(end_jump)?;
+            }
+            return Ok(());
+        }
+
         self.left.compile(compiler)?;
+
+        // fuse an Int literal on the right into a single superinstruction, so
+        // patterns like 'n - 1' cost one dispatch instead of two
+        if left_type == Type::Int {
+            if let Some(lit) = self.right.downcast_ref::<Literal>() {
+                let fused = match self.op {
+                    TokenType::Plus => Some(OpCode::IntAddConstant),
+                    TokenType::Minus => Some(OpCode::IntSubtractConstant),
+                    TokenType::Star => Some(OpCode::IntMultiplyConstant),
+                    TokenType::Eq => Some(OpCode::IntEqualConstant),
+                    TokenType::LT => Some(OpCode::IntLessConstant),
+                    _ => None,
+                };
+                if let Some(opcode) = fused {
+                    let value = lit.value().parse::<i64>().map_err(|e| e.to_string())?;
+                    return compiler.write_constant_op(opcode, Value::from_i64(value));
+                }
+            }
+        }
+
         self.right.compile(compiler)?;
 
-        match left_type {
-            Type::Int => {
-                compiler.write_opcode(match self.op {
-                    TokenType::Eq => OpCode::IntEqual,
-                    TokenType::NEq => OpCode::IntNotEqual,
-                    TokenType::GT => OpCode::IntGreater,
-                    TokenType::GEq => OpCode::IntGreaterEqual,
-                    TokenType::LT => OpCode::IntLess,
-                    TokenType::LEq => OpCode::IntLessEqual,
-                    TokenType::Plus => OpCode::IntAdd,
-                    TokenType::Minus => OpCode::IntSubtract,
-                    TokenType::Star => OpCode::IntMultiply,
-                    TokenType::Slash => OpCode::IntDivide,
-                    TokenType::To => OpCode::To,
-                    x => return Err(format!(
-                        "Operator {:?} not supported for type {:?}",
-                        x, left_type
-                    )),
-                })
-            },
-            Type::Float => {
-                compiler.write_opcode(match self.op {
-                    TokenType::Eq => OpCode::FloatEqual,
-                    TokenType::NEq => OpCode::FloatNotEqual,
-                    TokenType::GT => OpCode::FloatGreater,
-                    TokenType::GEq => OpCode::FloatGreaterEqual,
-                    TokenType::LT => OpCode::FloatLess,
-                    TokenType::LEq => OpCode::FloatLessEqual,
-                    TokenType::Plus => OpCode::FloatAdd,
-                    TokenType::Minus => OpCode::FloatSubtract,
-                    TokenType::Star => OpCode::FloatMultiply,
-                    TokenType::Slash => OpCode::FloatDivide,
-                    x => return Err(format!(
-                        "Operator {:?} not supported for type {:?}",
-                        x, left_type
-                    ))
-                })
-            },
-            Type::Bool => {
-                compiler.write_opcode(match self.op {
-                    TokenType::Eq => OpCode::BoolEqual,
-                    TokenType::NEq => OpCode::BoolNotEqual,
-                    TokenType::And => OpCode::And,
-                    TokenType::Or => OpCode::Or,
-                    x => return Err(format!(
-                        "Operator {:?} not supported for type {:?}",
-                        x, left_type
-                    ))
-                })
-            },
-            Type::Str => {
-                compiler.write_opcode(match self.op {
-                    TokenType::Eq => OpCode::HeapEqual,
-                    TokenType::NEq => OpCode::HeapNotEqual,
-                    TokenType::Plus => OpCode::Concat,
-                    x => return Err(format!(
-                        "Operator {:?} not supported for type {:?}",
-                        x, left_type
-                    ))
-                })
-            },
-            Type::Arr(t) => {
-                compiler.write_opcode(match self.op {
-                    TokenType::Eq => OpCode::HeapEqual,
-                    TokenType::NEq => OpCode::HeapNotEqual,
-                    TokenType::Plus => OpCode::Concat,
-                    x => return Err(format!(
-                        "Operator {:?} not supported for type {:?}",
-                        x, t
-                    ))
-                })
-            },
-            x => return Err(format!(
-                "Type {:?} not yet supported for binary operation", x
-            ))
-        };
+        compiler.write_opcode(opcode_for(self.op, &left_type)?);
         Ok(())
     }
 
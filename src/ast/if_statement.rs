@@ -55,6 +55,16 @@ impl Expression for IfStatement {
 
     fn compile(&self, compiler: &mut Compiler) -> Result<(), String> {
         let _typ = self.get_type()?; // will error if types don't match or condition is not a bool
+        // a condition that folded to a Bool literal decides the branch at
+        // compile time; only the taken branch is emitted, with no jumps
+        if let Some(lit) = self.condition.downcast_ref::<Literal>() {
+            return if lit.value() == "true" {
+                self.then_branch.compile(compiler)
+            }
+            else {
+                self.else_branch.compile(compiler)
+            };
+        }
         self.condition.compile(compiler)?;
         let jump_if_idx = compiler.write_jump(OpCode::JumpIfFalse)?;
         self.then_branch.compile(compiler)?;
@@ -13,6 +13,9 @@ impl Literal {
     pub fn new(typ: Type, value: String) -> Self {
         Self { typ, value, parent: None }
     }
+    pub fn value(&self) -> &str {
+        &self.value
+    }
 }
 
 impl Expression for Literal {
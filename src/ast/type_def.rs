@@ -58,7 +58,7 @@ impl Expression for TypeDef {
     fn compile(&self, compiler: &mut Compiler) -> Result<(), String> {
         let mut fields = Vec::new();
         for f in self.fields.iter() {
-            fields.push((f.name.clone(), f.get_type()?.is_heap()));
+            fields.push((Rc::from(f.name.as_str()), f.get_type()?.is_heap()));
         }
         let typedef = HeapValue::TypeDef(Rc::new(
             values::TypeDef::new(self.name.clone(), fields)
@@ -16,6 +16,27 @@ impl Unary {
     }
 }
 
+// Negation of a numeric literal and '!' on a boolean literal fold to a new
+// literal at parse time; anything else compiles as a normal Unary
+pub fn fold_unary(op: TokenType, right: &dyn Expression) -> Option<Literal> {
+    let right = right.downcast_ref::<Literal>()?;
+    match (op, right.get_type().ok()?) {
+        (TokenType::Minus, Type::Int) => {
+            let value = right.value().parse::<i64>().ok()?.checked_neg()?;
+            Some(Literal::new(Type::Int, value.to_string()))
+        },
+        (TokenType::Minus, Type::Float) => {
+            let value = -right.value().parse::<f64>().ok()?;
+            Some(Literal::new(Type::Float, format!("{:?}", value)))
+        },
+        (TokenType::Bang, Type::Bool) => {
+            let value = !right.value().parse::<bool>().ok()?;
+            Some(Literal::new(Type::Bool, value.to_string()))
+        },
+        _ => None,
+    }
+}
+
 impl Expression for Unary {
     fn get_type(&self) -> Result<Type, String> {
         let right_type = self.right.get_type()?;
@@ -1,185 +1,193 @@
 use rustc_hash::FxHashMap;
+use std::rc::Rc;
 use std::time::UNIX_EPOCH;
 
-use lazy_static::lazy_static;
-
 use crate::ast::Type;
 use crate::values::{HeapValue, NativeFunction, Value};
 
-lazy_static! {
-    static ref PRINT: NativeFunction = NativeFunction {
-        name: "print",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: true,
-        function: |vm, _args, heap_args| {
-            Ok(match &heap_args[0] {
-                HeapValue::String(x) => {
-                    println!("{}", x);
-                    vm.heap_stack.push(HeapValue::String(x.clone()));
-                },
-                _ => unreachable!()
-            })
-        }
-    };
-    static ref TIME: NativeFunction = NativeFunction {
-        name: "time",
-        arity: 0,
-        heap_arity: 0,
-        return_is_heap: false,
-        function: |vm, _args, _heap_args| {
-            let now = UNIX_EPOCH.elapsed().unwrap().as_micros();
-            vm.stack.push(Value { i: now as i64 });
-            Ok(())
-        }
-    };
-
-    static ref ITOF: NativeFunction = NativeFunction {
-        name: "itof",
-        arity: 1,
-        heap_arity: 0,
-        return_is_heap: false,
-        function: |vm, args, _heap_args| {
-            vm.stack.push(unsafe { Value { f: (args[0].i as f64) } });
-            Ok(())
-        }
-    };
-    static ref FTOI: NativeFunction = NativeFunction {
-        name: "ftoi",
-        arity: 1,
-        heap_arity: 0,
-        return_is_heap: false,
-        function: |vm, args, _heap_args| {
-            vm.stack.push(unsafe { Value { i: (args[0].f as i64) } });
-            Ok(())
-        }
-    };
-
-    static ref MOD: NativeFunction = NativeFunction {
-        name: "mod",
-        arity: 2,
-        heap_arity: 0,
-        return_is_heap: false,
-        function: |vm, args, _heap_args| {
-            vm.stack.push(unsafe { Value { i: (args[0].i.rem_euclid(args[1].i)) } });
-            Ok(())
-        }
-    };
-    static ref POWI: NativeFunction = NativeFunction {
-        name: "powi",
-        arity: 2,
-        heap_arity: 0,
-        return_is_heap: false,
-        function: |vm, args, _heap_args| {
-            vm.stack.push(unsafe { Value { i: (args[0].i.pow(args[1].i as u32)) } });
-            Ok(())
-        }
-    };
-    static ref POWF: NativeFunction = NativeFunction {
-        name: "powf",
-        arity: 2,
-        heap_arity: 0,
-        return_is_heap: false,
-        function: |vm, args, _heap_args| {
-            vm.stack.push(unsafe { Value { f: (args[0].f.powf(args[1].f)) } });
-            Ok(())
-        }
-    };
-
-    static ref SUMI: NativeFunction = NativeFunction {
-        name: "sumi",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: false,
-        function: |vm, _args, heap_args| {
-            Ok(match &heap_args[0] {
-                HeapValue::LazyIter(iter) => unsafe {
-                    vm.stack.push(Value { i: iter.clone().into_iter().map(|x| x.i).sum() });
-                },
-                _ => unreachable!()
-            })
-        }
-    };
-    static ref PRODI: NativeFunction = NativeFunction {
-        name: "prodi",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: false,
-        function: |vm, _args, heap_args| {
-            Ok(match &heap_args[0] {
-                HeapValue::LazyIter(iter) => unsafe {
-                    vm.stack.push(Value { i: iter.clone().into_iter().map(|x| x.i).product() });
-                },
-                _ => unreachable!()
-            })
-        }
-    };
-
-    static ref SUMF: NativeFunction = NativeFunction {
-        name: "sumf",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: false,
-        function: |vm, _args, heap_args| {
-            Ok(match &heap_args[0] {
-                HeapValue::LazyIter(iter) => unsafe {
-                    vm.stack.push(Value { f: iter.clone().into_iter().map(|x| x.f).sum() });
-                },
-                _ => unreachable!()
-            })
-        }
-    };
-    static ref PRODF: NativeFunction = NativeFunction {
-        name: "prodf",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: false,
-        function: |vm, _args, heap_args| {
-            Ok(match &heap_args[0] {
-                HeapValue::LazyIter(iter) => unsafe {
-                    vm.stack.push(Value { f: iter.clone().into_iter().map(|x| x.f).product() });
-                },
-                _ => unreachable!()
-            })
-        }
-    };
-
-    static ref ALL: NativeFunction = NativeFunction {
-        name: "all",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: false,
-        function: |vm, _args, heap_args| {
-            match &heap_args[0] {
-                HeapValue::LazyIter(iter) => unsafe {
-                    let v = iter.clone().into_iter().all(|x| x.b);
-                    vm.stack.push(Value::from_bool(v));
-                    Ok(())
-                }
-                _ => unreachable!()
+static PRINT: NativeFunction = NativeFunction {
+    name: "print",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: true,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        match &arg {
+            HeapValue::String(x) => println!("{}", x),
+            _ => unreachable!()
+        };
+        vm.heap_stack.push(arg);
+        Ok(())
+    }
+};
+static TIME: NativeFunction = NativeFunction {
+    name: "time",
+    arity: 0,
+    heap_arity: 0,
+    return_is_heap: false,
+    function: |vm| {
+        let now = UNIX_EPOCH.elapsed().unwrap().as_micros();
+        vm.stack.push(Value { i: now as i64 });
+        Ok(())
+    }
+};
+
+static ITOF: NativeFunction = NativeFunction {
+    name: "itof",
+    arity: 1,
+    heap_arity: 0,
+    return_is_heap: false,
+    function: |vm| {
+        let x = vm.stack.pop().expect("Expected argument on stack");
+        vm.stack.push(unsafe { Value { f: (x.i as f64) } });
+        Ok(())
+    }
+};
+static FTOI: NativeFunction = NativeFunction {
+    name: "ftoi",
+    arity: 1,
+    heap_arity: 0,
+    return_is_heap: false,
+    function: |vm| {
+        let x = vm.stack.pop().expect("Expected argument on stack");
+        vm.stack.push(unsafe { Value { i: (x.f as i64) } });
+        Ok(())
+    }
+};
+
+static MOD: NativeFunction = NativeFunction {
+    name: "mod",
+    arity: 2,
+    heap_arity: 0,
+    return_is_heap: false,
+    function: |vm| {
+        let b = vm.stack.pop().expect("Expected argument on stack");
+        let a = vm.stack.pop().expect("Expected argument on stack");
+        vm.stack.push(unsafe { Value { i: (a.i.rem_euclid(b.i)) } });
+        Ok(())
+    }
+};
+static POWI: NativeFunction = NativeFunction {
+    name: "powi",
+    arity: 2,
+    heap_arity: 0,
+    return_is_heap: false,
+    function: |vm| {
+        let b = vm.stack.pop().expect("Expected argument on stack");
+        let a = vm.stack.pop().expect("Expected argument on stack");
+        vm.stack.push(unsafe { Value { i: (a.i.pow(b.i as u32)) } });
+        Ok(())
+    }
+};
+static POWF: NativeFunction = NativeFunction {
+    name: "powf",
+    arity: 2,
+    heap_arity: 0,
+    return_is_heap: false,
+    function: |vm| {
+        let b = vm.stack.pop().expect("Expected argument on stack");
+        let a = vm.stack.pop().expect("Expected argument on stack");
+        vm.stack.push(unsafe { Value { f: (a.f.powf(b.f)) } });
+        Ok(())
+    }
+};
+
+static SUMI: NativeFunction = NativeFunction {
+    name: "sumi",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: false,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        Ok(match arg {
+            HeapValue::LazyIter(iter) => unsafe {
+                vm.stack.push(Value { i: iter.into_iter().map(|x| x.i).sum() });
+            },
+            _ => unreachable!()
+        })
+    }
+};
+static PRODI: NativeFunction = NativeFunction {
+    name: "prodi",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: false,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        Ok(match arg {
+            HeapValue::LazyIter(iter) => unsafe {
+                vm.stack.push(Value { i: iter.into_iter().map(|x| x.i).product() });
+            },
+            _ => unreachable!()
+        })
+    }
+};
+
+static SUMF: NativeFunction = NativeFunction {
+    name: "sumf",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: false,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        Ok(match arg {
+            HeapValue::LazyIter(iter) => unsafe {
+                vm.stack.push(Value { f: iter.into_iter().map(|x| x.f).sum() });
+            },
+            _ => unreachable!()
+        })
+    }
+};
+static PRODF: NativeFunction = NativeFunction {
+    name: "prodf",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: false,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        Ok(match arg {
+            HeapValue::LazyIter(iter) => unsafe {
+                vm.stack.push(Value { f: iter.into_iter().map(|x| x.f).product() });
+            },
+            _ => unreachable!()
+        })
+    }
+};
+
+static ALL: NativeFunction = NativeFunction {
+    name: "all",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: false,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        match arg {
+            HeapValue::LazyIter(iter) => unsafe {
+                let v = iter.into_iter().all(|x| x.b);
+                vm.stack.push(Value::from_bool(v));
+                Ok(())
             }
+            _ => unreachable!()
         }
-    };
-    static ref ANY: NativeFunction = NativeFunction {
-        name: "any",
-        arity: 0,
-        heap_arity: 1,
-        return_is_heap: false,
-        function: |vm, _args, heap_args| {
-            match &heap_args[0] {
-                // HeapValue::Array(arr) => unsafe {
-                //     vm.stack.push(Value { b: arr.into_iter().any(|x| x.b) });
-                // },
-                HeapValue::LazyIter(iter) => unsafe {
-                    let v = iter.clone().into_iter().any(|x| x.b);
-                    vm.stack.push(Value::from_bool(v));
-                    Ok(())
-                }
-                _ => unreachable!()
+    }
+};
+static ANY: NativeFunction = NativeFunction {
+    name: "any",
+    arity: 0,
+    heap_arity: 1,
+    return_is_heap: false,
+    function: |vm| {
+        let arg = vm.heap_stack.pop().expect("Expected argument on heap stack");
+        match arg {
+            HeapValue::LazyIter(iter) => unsafe {
+                let v = iter.into_iter().any(|x| x.b);
+                vm.stack.push(Value::from_bool(v));
+                Ok(())
             }
+            _ => unreachable!()
         }
-    };
-}
+    }
+};
 
 pub fn builtin_types() -> FxHashMap<String, Type> {
     let mut map = FxHashMap::default();
@@ -206,32 +214,32 @@ pub fn builtin_types() -> FxHashMap<String, Type> {
     map
 }
 
-pub fn builtins() -> FxHashMap<String, Value> {
+pub fn builtins() -> FxHashMap<Rc<str>, Value> {
     let mut map = FxHashMap::default();
-    map.insert("E".to_string(), Value { f: std::f64::consts::E });
+    map.insert(Rc::from("E"), Value { f: std::f64::consts::E });
 
     map
 }
 
-pub fn heap_builtins() -> FxHashMap<String, HeapValue> {
+pub fn heap_builtins() -> FxHashMap<Rc<str>, HeapValue> {
     let mut map = FxHashMap::default();
-    map.insert("print[Str]".to_string(), HeapValue::NativeFunction(&PRINT));
-    map.insert("time".to_string(), HeapValue::NativeFunction(&TIME));
-    map.insert("float[Int]".to_string(), HeapValue::NativeFunction(&ITOF));
-    map.insert("int[Float]".to_string(), HeapValue::NativeFunction(&FTOI));
+    map.insert(Rc::from("print[Str]"), HeapValue::NativeFunction(&PRINT));
+    map.insert(Rc::from("time"), HeapValue::NativeFunction(&TIME));
+    map.insert(Rc::from("float[Int]"), HeapValue::NativeFunction(&ITOF));
+    map.insert(Rc::from("int[Float]"), HeapValue::NativeFunction(&FTOI));
 
-    map.insert("mod[Int, Int]".to_string(), HeapValue::NativeFunction(&MOD));
-    map.insert("pow[Int, Int]".to_string(), HeapValue::NativeFunction(&POWI));
-    map.insert("pow[Float, Float]".to_string(), HeapValue::NativeFunction(&POWF));
+    map.insert(Rc::from("mod[Int, Int]"), HeapValue::NativeFunction(&MOD));
+    map.insert(Rc::from("pow[Int, Int]"), HeapValue::NativeFunction(&POWI));
+    map.insert(Rc::from("pow[Float, Float]"), HeapValue::NativeFunction(&POWF));
 
-    map.insert("sum[Iter(Int)]".to_string(), HeapValue::NativeFunction(&SUMI));
-    map.insert("prod[Iter(Int)]".to_string(), HeapValue::NativeFunction(&PRODI));
+    map.insert(Rc::from("sum[Iter(Int)]"), HeapValue::NativeFunction(&SUMI));
+    map.insert(Rc::from("prod[Iter(Int)]"), HeapValue::NativeFunction(&PRODI));
 
-    map.insert("sum[Iter(Float)]".to_string(), HeapValue::NativeFunction(&SUMF));
-    map.insert("prod[Iter(Float)]".to_string(), HeapValue::NativeFunction(&PRODF));
+    map.insert(Rc::from("sum[Iter(Float)]"), HeapValue::NativeFunction(&SUMF));
+    map.insert(Rc::from("prod[Iter(Float)]"), HeapValue::NativeFunction(&PRODF));
 
-    map.insert("all[Iter(Bool)]".to_string(), HeapValue::NativeFunction(&ALL));
-    map.insert("any[Iter(Bool)]".to_string(), HeapValue::NativeFunction(&ANY));
+    map.insert(Rc::from("all[Iter(Bool)]"), HeapValue::NativeFunction(&ALL));
+    map.insert(Rc::from("any[Iter(Bool)]"), HeapValue::NativeFunction(&ANY));
 
     map
 }
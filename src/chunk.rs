@@ -96,6 +96,13 @@ pub enum OpCode {
     Filter,
     Len,
     ZipMap,
+
+    // Fused int operations with a constant right operand
+    IntAddConstant,
+    IntSubtractConstant,
+    IntMultiplyConstant,
+    IntEqualConstant,
+    IntLessConstant,
 }
 
 impl From<u8> for OpCode {
@@ -143,6 +150,10 @@ impl Chunk {
 
 
     pub fn create_constant(&mut self, value: Value) -> Result<u16, &'static str> {
+        // reuse an existing slot if this value is already in the table
+        if let Some(idx) = self.constants.iter().position(|c| *c == value) {
+            return Ok(idx as u16);
+        }
         self.constants.push(value);
         let idx = self.constants.len() - 1;
         if idx > u16::MAX as usize {
@@ -155,8 +166,22 @@ impl Chunk {
         self.write_opcode(OpCode::Constant, line);
         self.bytes.write_u16::<BigEndian>(idx as u16).map_err(|_| "Failed to write index of constant to bytes")
     }
+    // for fused opcodes that carry their constant operand inline
+    pub fn write_constant_op(&mut self, opcode: OpCode, value: Value, line: usize) -> Result<(), &'static str> {
+        let idx = self.create_constant(value)?;
+        self.write_opcode(opcode, line);
+        self.bytes.write_u16::<BigEndian>(idx as u16).map_err(|_| "Failed to write index of constant to bytes")
+    }
 
     pub fn create_heap_constant(&mut self, value: HeapValue) -> Result<u16, &'static str> {
+        // strings (including global-variable names) repeat often; share their slots
+        if let HeapValue::String(s) = &value {
+            if let Some(idx) = self.heap_constants.iter().position(
+                |c| matches!(c, HeapValue::String(other) if other == s)
+            ) {
+                return Ok(idx as u16);
+            }
+        }
         self.heap_constants.push(value);
         let idx = self.heap_constants.len() - 1;
         if idx > u16::MAX as usize {
@@ -177,7 +202,7 @@ impl Chunk {
         heap_upvalues: Vec<compiler::Upvalue>,
         line: usize
     ) -> Result<(), &'static str> {
-        let closure = HeapValue::Closure(Box::new(closure));
+        let closure = HeapValue::Closure(Rc::new(closure));
         let idx = self.create_heap_constant(closure)?;
         self.write_opcode(OpCode::Closure, line);
         self.bytes.write_u16::<BigEndian>(idx).map_err(|_| "Failed to write index of closure to bytes")?;
@@ -202,7 +227,7 @@ impl Chunk {
         self.bytes.write_u16::<BigEndian>(idx).map_err(|_| "Failed to write index of global variable to bytes")
     }
     pub fn write_get_global(&mut self, name: String, is_heap: bool, line: usize) -> Result<(), &'static str> {
-        let name = HeapValue::String(Rc::new(name));
+        let name = HeapValue::String(Rc::from(name));
         let idx = self.create_heap_constant(name)?;
         self.write_opcode(
             if is_heap { OpCode::GetHeapGlobal } else { OpCode::GetGlobal },
@@ -398,6 +423,15 @@ impl Chunk {
                 }
             },
 
+            OpCode::IntAddConstant
+            | OpCode::IntSubtractConstant
+            | OpCode::IntMultiplyConstant
+            | OpCode::IntEqualConstant
+            | OpCode::IntLessConstant => {
+                let constant = self.read_constant(ip);
+                println!("{:04} {:?} {:?}", ip0, opcode, constant);
+            },
+
             x => println!("{:04} {:?}", ip0, x),
         }
     }
@@ -112,11 +112,14 @@ impl Compiler {
     pub fn write_constant(&mut self, value: Value) -> Result<(), String> {
         self.chunk().write_constant(value, 0).map_err(|e| e.to_string())
     }
+    pub fn write_constant_op(&mut self, opcode: OpCode, value: Value) -> Result<(), String> {
+        self.chunk().write_constant_op(opcode, value, 0).map_err(|e| e.to_string())
+    }
     pub fn write_heap_constant(&mut self, value: HeapValue) -> Result<(), String> {
         self.chunk().write_heap_constant(value, 0).map_err(|e| e.to_string())
     }
     pub fn write_string(&mut self, s: String) -> Result<(), String> {
-        let s = HeapValue::String(Rc::new(s));
+        let s = HeapValue::String(Rc::from(s));
         self.chunk().write_heap_constant(s, 0).map_err(|e| e.to_string())
     }
     pub fn write_array(&mut self, len: u16) -> Result<(), String> {
@@ -161,13 +164,18 @@ impl Compiler {
             }
             self.locals.heap_locals.pop();
         }
+        if n_pops == 0 && n_heap_pops == 0 {
+            // with no locals to discard, EndBlock would just pop the block's
+            // result and push it back; skip emitting it entirely
+            return Ok(());
+        }
         self.chunk().write_endblock(n_pops, n_heap_pops, is_heap, 0).map_err(|e| e.to_string())
     }
 
     pub fn create_variable(&mut self, name: String, typ: &ast::Type) -> Result<Option<u16>, String> {
         if self.locals.scope_depth == 0 {
             // create a global variable
-            let name_hv = HeapValue::String(Rc::new(name.clone()));
+            let name_hv = HeapValue::String(Rc::from(name.clone()));
             return match self.chunk().create_heap_constant(name_hv) {
                 Ok(idx) => {
                     self.typecontext.borrow_mut().insert(name, typ.clone());
@@ -1,6 +1,4 @@
-use rustc_hash::FxHashMap;
-
-use lazy_static::lazy_static;
+use std::sync::LazyLock;
 
 use crate::ast::{self, Expression};
 use crate::compiler::TypeContext;
@@ -36,6 +34,7 @@ impl Precedence {
 type PrefixParseFn = fn(&mut Parser) -> Box<dyn ast::Expression>;
 type InfixParseFn = fn(&mut Parser, Box<dyn ast::Expression>) -> Box<dyn ast::Expression>;
 
+#[derive(Copy, Clone)]
 struct ParseRule {
     prefix: Option<PrefixParseFn>,
     infix: Option<InfixParseFn>,
@@ -62,181 +61,111 @@ impl ParseRule {
     }
 }
 
-lazy_static! {
-    static ref RULES: FxHashMap<TokenType, ParseRule> = {
-        let mut map = FxHashMap::default();
-        // groupings
-        map.insert(
-            TokenType::LParen,
-            ParseRule::new(Some(Parser::grouping), Some(Parser::call), Precedence::Call),
-        );
-        map.insert(
-            TokenType::LBrace,
-            ParseRule::new(Some(Parser::block), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Dot,
-            ParseRule::new(None, Some(Parser::get_field), Precedence::Call),
-        );
-
-        // control flow
-        map.insert(
-            TokenType::If,
-            ParseRule::new(Some(Parser::if_statement), None, Precedence::None),
-        );
-
-        // object defs
-        map.insert(
-            TokenType::Pipe,
-            ParseRule::new(Some(Parser::function_def), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::LSquare,
-            ParseRule::new(Some(Parser::array), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Type,
-            ParseRule::new(Some(Parser::type_def), None, Precedence::None),
-        );
-
-        // literals
-        map.insert(
-            TokenType::Int,
-            ParseRule::new(Some(Parser::int), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Float,
-            ParseRule::new(Some(Parser::float), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Str,
-            ParseRule::new(Some(Parser::string), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::True,
-            ParseRule::new(Some(Parser::boolean), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::False,
-            ParseRule::new(Some(Parser::boolean), None, Precedence::None),
-        );
-
-        // operators
-        map.insert(
-            TokenType::Bang,
-            ParseRule::new(Some(Parser::unary), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Plus,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Term),
-        );
-        map.insert(
-            TokenType::Minus,
-            ParseRule::new(Some(Parser::unary), Some(Parser::binary), Precedence::Term),
-        );
-        map.insert(
-            TokenType::Star,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Factor),
-        );
-        map.insert(
-            TokenType::Slash,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Factor),
-        );
-        
-        map.insert(
-            TokenType::And,
-            ParseRule::new(None, Some(Parser::binary), Precedence::And),
-        );
-        map.insert(
-            TokenType::Or,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Or),
-        );
-        
-        map.insert(
-            TokenType::To,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Range),
-        );
-        map.insert(
-            TokenType::At,
-            ParseRule::new(Some(Parser::unary), None, Precedence::None),
-        );
-
-        map.insert(
-            TokenType::Eq,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Equality),
-        );
-        map.insert(
-            TokenType::NEq,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Equality),
-        );
-        map.insert(
-            TokenType::LT,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Comparison),
-        );
-        map.insert(
-            TokenType::LEq,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Comparison),
-        );
-        map.insert(
-            TokenType::GT,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Comparison),
-        );
-        map.insert(
-            TokenType::GEq,
-            ParseRule::new(None, Some(Parser::binary), Precedence::Comparison),
-        );
-
-        map.insert(
-            TokenType::RightArrow,
-            ParseRule::new(None, Some(Parser::map), Precedence::Assignment),
-        );
-
-        // identifiers
-        map.insert(
-            TokenType::Ident,
-            ParseRule::new(Some(Parser::variable), None, Precedence::None),
-        );
-
-        map.insert(
-            TokenType::Some,
-            ParseRule::new(Some(Parser::some), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Reduce,
-            ParseRule::new(Some(Parser::reduce), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Filter,
-            ParseRule::new(Some(Parser::filter), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Len,
-            ParseRule::new(Some(Parser::len), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::ZipMap,
-            ParseRule::new(Some(Parser::zipmap), None, Precedence::None),
-        );
-        map.insert(
-            TokenType::Unwrap,
-            ParseRule::new(Some(Parser::unwrap), None, Precedence::None),
-        );
-
-        // define default rules
-        for ttype in enum_iterator::all::<TokenType>() {
-            if map.get(&ttype).is_none() {
-                map.insert(ttype, ParseRule::default());
-            }
-        }
-
-        map
-    };
-}
+const N_TOKEN_TYPES: usize = TokenType::EoF as usize + 1;
+
+// indexed by `TokenType as usize`, so rule lookups are a plain array read
+static RULES: LazyLock<[ParseRule; N_TOKEN_TYPES]> = LazyLock::new(|| {
+    let mut rules = [ParseRule::default(); N_TOKEN_TYPES];
+    // groupings
+    rules[TokenType::LParen as usize] =
+        ParseRule::new(Some(Parser::grouping), Some(Parser::call), Precedence::Call);
+    rules[TokenType::LBrace as usize] =
+        ParseRule::new(Some(Parser::block), None, Precedence::None);
+    rules[TokenType::Dot as usize] =
+        ParseRule::new(None, Some(Parser::get_field), Precedence::Call);
+
+    // control flow
+    rules[TokenType::If as usize] =
+        ParseRule::new(Some(Parser::if_statement), None, Precedence::None);
+
+    // object defs
+    rules[TokenType::Pipe as usize] =
+        ParseRule::new(Some(Parser::function_def), None, Precedence::None);
+    rules[TokenType::LSquare as usize] =
+        ParseRule::new(Some(Parser::array), None, Precedence::None);
+    rules[TokenType::Type as usize] =
+        ParseRule::new(Some(Parser::type_def), None, Precedence::None);
+
+    // literals
+    rules[TokenType::Int as usize] =
+        ParseRule::new(Some(Parser::int), None, Precedence::None);
+    rules[TokenType::Float as usize] =
+        ParseRule::new(Some(Parser::float), None, Precedence::None);
+    rules[TokenType::Str as usize] =
+        ParseRule::new(Some(Parser::string), None, Precedence::None);
+    rules[TokenType::True as usize] =
+        ParseRule::new(Some(Parser::boolean), None, Precedence::None);
+    rules[TokenType::False as usize] =
+        ParseRule::new(Some(Parser::boolean), None, Precedence::None);
+
+    // operators
+    rules[TokenType::Bang as usize] =
+        ParseRule::new(Some(Parser::unary), None, Precedence::None);
+    rules[TokenType::Plus as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Term);
+    rules[TokenType::Minus as usize] =
+        ParseRule::new(Some(Parser::unary), Some(Parser::binary), Precedence::Term);
+    rules[TokenType::Star as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Factor);
+    rules[TokenType::Slash as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Factor);
+    
+    rules[TokenType::And as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::And);
+    rules[TokenType::Or as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Or);
+    
+    rules[TokenType::To as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Range);
+    rules[TokenType::At as usize] =
+        ParseRule::new(Some(Parser::unary), None, Precedence::None);
+
+    rules[TokenType::Eq as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Equality);
+    rules[TokenType::NEq as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Equality);
+    rules[TokenType::LT as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Comparison);
+    rules[TokenType::LEq as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Comparison);
+    rules[TokenType::GT as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Comparison);
+    rules[TokenType::GEq as usize] =
+        ParseRule::new(None, Some(Parser::binary), Precedence::Comparison);
+
+    rules[TokenType::RightArrow as usize] =
+        ParseRule::new(None, Some(Parser::map), Precedence::Assignment);
+
+    // identifiers
+    rules[TokenType::Ident as usize] =
+        ParseRule::new(Some(Parser::variable), None, Precedence::None);
+
+    rules[TokenType::Some as usize] =
+        ParseRule::new(Some(Parser::some), None, Precedence::None);
+    rules[TokenType::Reduce as usize] =
+        ParseRule::new(Some(Parser::reduce), None, Precedence::None);
+    rules[TokenType::Filter as usize] =
+        ParseRule::new(Some(Parser::filter), None, Precedence::None);
+    rules[TokenType::Len as usize] =
+        ParseRule::new(Some(Parser::len), None, Precedence::None);
+    rules[TokenType::ZipMap as usize] =
+        ParseRule::new(Some(Parser::zipmap), None, Precedence::None);
+    rules[TokenType::Unwrap as usize] =
+        ParseRule::new(Some(Parser::unwrap), None, Precedence::None);
+
+    rules
+});
 
 struct Parser {
     tokens: Vec<Token>,
+    // token types split out of `tokens` into a dense parallel vec, so the hot
+    // dispatch path reads one byte per token instead of a 40-byte Token
+    ttypes: Vec<TokenType>,
     current: usize,
     previous: usize,
+    // type of the token at `current`, kept in sync by `advance` so that the
+    // parser's many lookahead checks don't re-index the token list
+    cur_ttype: TokenType,
 
     had_error: bool,
     panic_mode: bool,
@@ -246,9 +175,11 @@ struct Parser {
 
 impl Parser {
     fn new(tokens: Vec<Token>) -> Self {
-        Self { tokens, current: 0, previous: 0, had_error: false, panic_mode: false, last_name: None }
+        let ttypes = tokens.iter().map(|t| t.ttype).collect::<Vec<_>>();
+        let cur_ttype = ttypes[0];
+        Self { tokens, ttypes, current: 0, previous: 0, cur_ttype, had_error: false, panic_mode: false, last_name: None }
     }
-    
+
     fn previous_token(&self) -> &Token {
         &self.tokens[self.previous]
     }
@@ -256,7 +187,7 @@ impl Parser {
         &self.tokens[self.current]
     }
     fn current_ttype(&self) -> TokenType {
-        self.current_token().ttype
+        self.cur_ttype
     }
     fn is_eof(&self) -> bool {
         self.current_ttype() == TokenType::EoF
@@ -285,7 +216,8 @@ impl Parser {
         self.previous = self.current;
         loop {
             self.current += 1;
-            if self.current_ttype() != TokenType::Error {
+            self.cur_ttype = self.ttypes[self.current];
+            if self.cur_ttype != TokenType::Error {
                 break;
             }
             self.error(None);
@@ -311,7 +243,7 @@ impl Parser {
             return None;
         }
         self.advance();
-        let prefix_rule = match RULES.get(&self.previous_token().ttype).unwrap().prefix {
+        let prefix_rule = match RULES[self.ttypes[self.previous] as usize].prefix {
             Some(rule) => rule,
             None => {
                 self.error(Some(
@@ -322,12 +254,15 @@ impl Parser {
         };
         let mut prefix = prefix_rule(self);
 
-        while
-            precedence <= RULES.get(&self.current_token().ttype).unwrap().precedence
-            && !self.is_eof()
-        {
+        loop {
+            // the rule consulted for precedence is the same one that supplies
+            // the infix handler, so fetch it once per operator
+            let rule = &RULES[self.current_ttype() as usize];
+            if precedence > rule.precedence || self.is_eof() {
+                break;
+            }
             self.advance();
-            let infix_rule = match RULES.get(&self.previous_token().ttype).unwrap().infix {
+            let infix_rule = match rule.infix {
                 Some(rule) => rule,
                 None => {
                     self.error(Some(
@@ -401,29 +336,50 @@ impl Parser {
     }
 
     fn unary(&mut self) -> Box<dyn ast::Expression> {
-        let token = self.previous_token().clone();
+        // consume any stacked prefix operators in a loop rather than recursing
+        // through parse_with_precedence once per operator; the operators sit at
+        // consecutive token indices, so a range is enough to remember them
+        let op_start = self.previous;
+        while matches!(
+            self.current_ttype(),
+            TokenType::Minus | TokenType::Bang | TokenType::At
+        ) {
+            self.advance();
+        }
+        let op_end = self.previous;
         let right = match self.parse_with_precedence(Precedence::Unary) {
             Some(expr) => expr,
             None => {
                 self.error(Some(
-                    format!("Expected something that could follow '{}', but couldn't find anything.", token.text)
+                    format!("Expected something that could follow '{}', but couldn't find anything.", self.tokens[op_end].text)
                 ));
                 return Box::new(ast::ErrorExpression{});
             }
         };
-        match ast::Unary::new(token.ttype, right) {
-            Ok(expr) => Box::new(expr),
-            Err(e) => {
-                self.error(Some(e));
-                Box::new(ast::ErrorExpression{})
-            }
+        // fold innermost-first, so the last operator binds tightest
+        let mut expr = right;
+        for op_idx in (op_start..=op_end).rev() {
+            let op = self.ttypes[op_idx];
+            if let Some(folded) = ast::fold_unary(op, expr.as_ref()) {
+                expr = Box::new(folded);
+                continue;
+            }
+            expr = match ast::Unary::new(op, expr) {
+                Ok(e) => Box::new(e),
+                Err(e) => {
+                    self.error(Some(e));
+                    return Box::new(ast::ErrorExpression{});
+                }
+            };
         }
+        expr
     }
 
     fn binary(&mut self, left: Box<dyn ast::Expression>) -> Box<dyn ast::Expression> {
-        let token = self.previous_token().clone();
-        let rule = RULES.get(&token.ttype).unwrap();
-        let precedence = if token.ttype == TokenType::RightArrow {
+        let op_idx = self.previous;
+        let op = self.ttypes[op_idx];
+        let rule = &RULES[op as usize];
+        let precedence = if op == TokenType::RightArrow {
             // right arrow has special precedence so that it is right associative
             rule.precedence
         }
@@ -434,12 +390,15 @@ impl Parser {
             Some(expr) => expr,
             None => {
                 self.error(Some(
-                    format!("Expected something that could follow '{}', but couldn't find anything.", token.text)
+                    format!("Expected something that could follow '{}', but couldn't find anything.", self.tokens[op_idx].text)
                 ));
                 return Box::new(ast::ErrorExpression{});
             }
         };
-        match ast::Binary::new(left, token.ttype, right) {
+        if let Some(folded) = ast::fold_binary(left.as_ref(), op, right.as_ref()) {
+            return Box::new(folded);
+        }
+        match ast::Binary::new(left, op, right) {
             Ok(expr) => Box::new(expr),
             Err(e) => {
                 self.error(Some(e));
@@ -747,12 +706,12 @@ impl Parser {
     }
 
     fn map(&mut self, left: Box<dyn ast::Expression>) -> Box<dyn ast::Expression> {
-        let token = self.previous_token().clone();
+        let op_idx = self.previous;
         let right = match self.parse_with_precedence(Precedence::Assignment) {
             Some(expr) => expr,
             None => {
                 self.error(Some(
-                    format!("Expected something that could follow '{}', but couldn't find anything.", token.text)
+                    format!("Expected something that could follow '{}', but couldn't find anything.", self.tokens[op_idx].text)
                 ));
                 return Box::new(ast::ErrorExpression{});
             }
@@ -1,16 +1,21 @@
 use crate::token::{TokenType, Token};
 
-struct Scanner {
-    source: Vec<char>,
+// The scanner works directly on the source's UTF-8 bytes rather than
+// collecting into a Vec<char> first. Every character the grammar dispatches on
+// is ASCII, and ASCII bytes never appear inside a multi-byte UTF-8 sequence,
+// so byte indexing is safe; non-ASCII bytes are only ever passed through
+// inside string literals and identifiers.
+struct Scanner<'a> {
+    source: &'a str,
     start: usize,
     current: usize,
     line: usize,
 }
 
-impl Scanner {
-    pub fn new(source: &str) -> Self {
+impl<'a> Scanner<'a> {
+    pub fn new(source: &'a str) -> Self {
         Self {
-            source: source.chars().collect(),
+            source,
             start: 0,
             current: 0,
             line: 1,
@@ -18,24 +23,24 @@ impl Scanner {
     }
 
     fn is_at_end(&self) -> bool {
-        self.peek(0) == '\0'
+        self.current >= self.source.len()
     }
 
-    fn peek(&self, offset: usize) -> char {
+    fn peek(&self, offset: usize) -> u8 {
         if self.current + offset >= self.source.len() {
-            '\0'
+            b'\0'
         }
         else {
-            self.source[self.current + offset]
+            self.source.as_bytes()[self.current + offset]
         }
     }
 
-    fn advance(&mut self) -> char {
+    fn advance(&mut self) -> u8 {
         self.current += 1;
-        self.source[self.current - 1]
+        self.source.as_bytes()[self.current - 1]
     }
 
-    fn match_char(&mut self, expected: char) -> bool {
+    fn match_char(&mut self, expected: u8) -> bool {
         if self.is_at_end() {
             return false;
         }
@@ -47,11 +52,10 @@ impl Scanner {
     }
 
     fn make_token(&self, ttype: TokenType) -> Token {
-        let text: String = self.source[self.start..self.current].iter().collect();
         Token {
             ttype,
             line: self.line,
-            text: text,
+            text: self.source[self.start..self.current].to_string(),
         }
     }
 
@@ -64,10 +68,10 @@ impl Scanner {
     }
 
     fn handle_comment(&mut self) {
-        if !self.match_char('?') {
+        if !self.match_char(b'?') {
             return;
         }
-        while !self.is_at_end() && self.peek(0) != '\n' {
+        while !self.is_at_end() && self.peek(0) != b'\n' {
             self.advance();
         }
     }
@@ -75,10 +79,10 @@ impl Scanner {
     fn handle_comments_and_whitespace(&mut self) {
         while !self.is_at_end() {
             match self.peek(0) {
-                '\n' => {
+                b'\n' => {
                     self.line += 1;
                 },
-                '?' => self.handle_comment(),
+                b'?' => self.handle_comment(),
                 x => if !x.is_ascii_whitespace() {
                     break
                 },
@@ -90,8 +94,8 @@ impl Scanner {
     }
 
     fn read_string(&mut self) -> Token {
-        while !self.is_at_end() && self.peek(0) != '"' {
-            if self.peek(0) == '\n' {
+        while !self.is_at_end() && self.peek(0) != b'"' {
+            if self.peek(0) == b'\n' {
                 self.line += 1;
             }
             self.advance();
@@ -107,7 +111,7 @@ impl Scanner {
         while self.peek(0).is_ascii_digit() {
             self.advance();
         }
-        if self.peek(0) == '.' && self.peek(1).is_ascii_digit() {
+        if self.peek(0) == b'.' && self.peek(1).is_ascii_digit() {
             self.advance();
             while self.peek(0).is_ascii_digit() {
                 self.advance();
@@ -118,15 +122,17 @@ impl Scanner {
     }
 
     fn read_ident_or_keyword(&mut self) -> Token {
-        while self.peek(0).is_alphanumeric() || self.peek(0) == '_' {
+        // any byte >= 0x80 starts or continues a multi-byte character, which is
+        // allowed inside identifiers
+        while self.peek(0).is_ascii_alphanumeric() || self.peek(0) == b'_' || self.peek(0) >= 0x80 {
             self.advance();
         }
-        let text: String = self.source[self.start..self.current].iter().collect();
+        let text = &self.source[self.start..self.current];
 
         Token {
-            ttype: TokenType::keyword_or_ident(text.as_str()),
+            ttype: TokenType::keyword_or_ident(text),
             line: self.line,
-            text,
+            text: text.to_string(),
         }
     }
 
@@ -139,82 +145,59 @@ impl Scanner {
             return self.make_token(TokenType::EoF);
         }
 
-        // match single-character tokens
+        // dispatch on the first character in a single match: single-character
+        // tokens, two-character operators, and literal starts all in one place
         let c = self.advance();
-        if let Some(ttype) = TokenType::single_char_keyword(c) {
-            return self.make_token(ttype);
-        }
         match c {
-            '!' => {
-                let is_neq = self.match_char('=');
-                return self.make_token(
-                    if is_neq {
-                        TokenType::NEq
-                    }
-                    else {
-                        TokenType::Bang
-                    }
-                );
+            b'(' => self.make_token(TokenType::LParen),
+            b')' => self.make_token(TokenType::RParen),
+            b'{' => self.make_token(TokenType::LBrace),
+            b'}' => self.make_token(TokenType::RBrace),
+            b'|' => self.make_token(TokenType::Pipe),
+            b'[' => self.make_token(TokenType::LSquare),
+            b']' => self.make_token(TokenType::RSquare),
+            b'.' => self.make_token(TokenType::Dot),
+            b',' => self.make_token(TokenType::Comma),
+            b'=' => self.make_token(TokenType::Eq),
+            b'+' => self.make_token(TokenType::Plus),
+            b'/' => self.make_token(TokenType::Slash),
+            b'*' => self.make_token(TokenType::Star),
+            b'@' => self.make_token(TokenType::At),
+            b'!' => {
+                let is_neq = self.match_char(b'=');
+                self.make_token(
+                    if is_neq { TokenType::NEq } else { TokenType::Bang }
+                )
             },
-            '>' => {
-                let is_geq = self.match_char('=');
-                return self.make_token(
-                    if is_geq {
-                        TokenType::GEq
-                    }
-                    else {
-                        TokenType::GT
-                    }
-                );
+            b'>' => {
+                let is_geq = self.match_char(b'=');
+                self.make_token(
+                    if is_geq { TokenType::GEq } else { TokenType::GT }
+                )
             },
-            '<' => {
-                let is_leq = self.match_char('=');
-                return self.make_token(
-                    if is_leq {
-                        TokenType::LEq
-                    }
-                    else {
-                        TokenType::LT
-                    }
-                );
+            b'<' => {
+                let is_leq = self.match_char(b'=');
+                self.make_token(
+                    if is_leq { TokenType::LEq } else { TokenType::LT }
+                )
             },
-            ':' => {
-                let is_assign = self.match_char('=');
-                return self.make_token(
-                    if is_assign {
-                        TokenType::Assign
-                    }
-                    else {
-                        TokenType::Colon
-                    }
-                );
+            b':' => {
+                let is_assign = self.match_char(b'=');
+                self.make_token(
+                    if is_assign { TokenType::Assign } else { TokenType::Colon }
+                )
             },
-            '-' => {
-                let is_right_arrow = self.match_char('>');
-                return self.make_token(
-                    if is_right_arrow {
-                        TokenType::RightArrow
-                    }
-                    else {
-                        TokenType::Minus
-                    }
+            b'-' => {
+                let is_right_arrow = self.match_char(b'>');
+                self.make_token(
+                    if is_right_arrow { TokenType::RightArrow } else { TokenType::Minus }
                 )
             },
-            _ => (),
-        };
-
-        // handle literals
-        if c == '"' {
-            return self.read_string();
-        }
-        if c.is_numeric() {
-            return self.read_number();
+            b'"' => self.read_string(),
+            c if c.is_ascii_digit() => self.read_number(),
+            c if c.is_ascii_alphabetic() || c == b'_' || c >= 0x80 => self.read_ident_or_keyword(),
+            _ => self.error_token("Unexpected character"),
         }
-        if c.is_alphabetic() || c == '_' {
-            return self.read_ident_or_keyword();
-        }
-
-        self.error_token("Unexpected character")
     }
 
     pub fn scan(&mut self) -> Vec<Token> {
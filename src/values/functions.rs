@@ -67,7 +67,8 @@ pub struct NativeFunction {
     pub arity: u8,
     pub heap_arity: u8,
     pub return_is_heap: bool,
-    pub function: fn(&mut VM, &[Value], &[HeapValue]) -> Result<(), InterpreterError>,
+    // pops its own arguments off the VM's stacks and pushes its result
+    pub function: fn(&mut VM) -> Result<(), InterpreterError>,
 }
 
 impl Debug for NativeFunction {
@@ -5,12 +5,12 @@ use super::{Closure, NativeFunction, LazyIter, Object, TypeDef, Value};
 
 #[derive(Debug, Clone)]
 pub enum HeapValue {
-    String(Rc<String>),
+    String(Rc<str>),
     Array(Rc<[Value]>),
     ArrayHeap(Rc<[HeapValue]>),
     Maybe(Option<Value>),
     MaybeHeap(Option<Box<HeapValue>>),
-    Closure(Box<Closure>),
+    Closure(Rc<Closure>),
     NativeFunction(&'static NativeFunction),
     TypeDef(Rc<TypeDef>),
     Object(Rc<Object>),
@@ -10,8 +10,15 @@ use super::{Closure, HeapValue, NativeFunction, TypeDef, Value};
 
 pub trait LazyIter<T: Clone>: DynClone + Debug {
     fn next(&mut self) -> Option<T>;
+    // number of remaining elements, when knowable without consuming the iterator
+    fn size_hint(&self) -> Option<usize> {
+        None
+    }
     fn into_array(&mut self) -> Rc<[T]> {
-        let mut arr = Vec::new();
+        let mut arr = match self.size_hint() {
+            Some(n) => Vec::with_capacity(n),
+            None => Vec::new(),
+        };
         while let Some(x) = self.next() {
             arr.push(x);
         }
@@ -51,6 +58,10 @@ impl<T: Clone + Debug> LazyIter<T> for ArrayIter<T> {
         }
     }
 
+    fn size_hint(&self) -> Option<usize> {
+        Some(self.array.len() - self.idx)
+    }
+
     fn into_array(&mut self) -> Rc<[T]> {
         self.array.clone()
     }
@@ -80,6 +91,15 @@ impl LazyIter<Value> for RangeIter {
             None
         }
     }
+
+    fn size_hint(&self) -> Option<usize> {
+        Some((self.end - self.current + 1).max(0) as usize)
+    }
+
+    fn into_array(&mut self) -> Rc<[Value]> {
+        // the length is known up front, so collect in a single tight loop
+        (self.current..=self.end).map(Value::from_i64).collect()
+    }
 }
 
 #[derive(Clone, Debug)]
@@ -106,6 +126,14 @@ impl LazyIter<Value> for ReverseRangeIter {
             None
         }
     }
+
+    fn size_hint(&self) -> Option<usize> {
+        Some((self.current - self.end + 1).max(0) as usize)
+    }
+
+    fn into_array(&mut self) -> Rc<[Value]> {
+        (self.end..=self.current).rev().map(Value::from_i64).collect()
+    }
 }
 
 // An iterator that iterates over some input iterator, calls a closure, and yields the closure's result
@@ -113,18 +141,21 @@ impl LazyIter<Value> for ReverseRangeIter {
 #[derive(Clone, Debug)]
 pub struct MapIter<T: Debug + Clone> {
     iter: Box<dyn LazyIter<T>>,
-    closure: Box<Closure>,
+    closure: Rc<Closure>,
     vm: *mut VM,
 }
 
 impl<T: Debug + Clone> MapIter<T> {
-    pub fn new(iter: Box<dyn LazyIter<T>>, closure: Box<Closure>, vm: *mut VM) -> MapIter<T> {
+    pub fn new(iter: Box<dyn LazyIter<T>>, closure: Rc<Closure>, vm: *mut VM) -> MapIter<T> {
         debug_assert!(!closure.function.return_is_heap);
         Self { iter, closure, vm }
     }
 }
 
 impl LazyIter<Value> for MapIter<Value> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<Value> {
         match self.iter.next() {
             None => None,
@@ -139,6 +170,9 @@ impl LazyIter<Value> for MapIter<Value> {
 }
 
 impl LazyIter<Value> for MapIter<HeapValue> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<Value> {
         match self.iter.next() {
             None => None,
@@ -158,18 +192,21 @@ impl LazyIter<Value> for MapIter<HeapValue> {
 #[derive(Clone, Debug)]
 pub struct MapIterHeap<T: Debug + Clone> {
     iter: Box<dyn LazyIter<T>>,
-    closure: Box<Closure>,
+    closure: Rc<Closure>,
     vm: *mut VM,
 }
 
 impl<T: Debug + Clone> MapIterHeap<T> {
-    pub fn new(iter: Box<dyn LazyIter<T>>, closure: Box<Closure>, vm: *mut VM) -> MapIterHeap<T> {
+    pub fn new(iter: Box<dyn LazyIter<T>>, closure: Rc<Closure>, vm: *mut VM) -> MapIterHeap<T> {
         debug_assert!(closure.function.return_is_heap);
         Self { iter, closure, vm }
     }
 }
 
 impl LazyIter<HeapValue> for MapIterHeap<Value> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<HeapValue> {
         match self.iter.next() {
             None => None,
@@ -184,6 +221,9 @@ impl LazyIter<HeapValue> for MapIterHeap<Value> {
 }
 
 impl LazyIter<HeapValue> for MapIterHeap<HeapValue> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<HeapValue> {
         match self.iter.next() {
             None => None,
@@ -214,6 +254,9 @@ impl<T: Debug + Clone> MapIterNative<T> {
 }
 
 impl LazyIter<Value> for MapIterNative<Value> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<Value> {
         match self.iter.next() {
             None => None,
@@ -228,6 +271,9 @@ impl LazyIter<Value> for MapIterNative<Value> {
 }
 
 impl LazyIter<Value> for MapIterNative<HeapValue> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<Value> {
         match self.iter.next() {
             None => None,
@@ -257,6 +303,9 @@ impl<T: Debug + Clone> MapIterNativeHeap<T> {
 }
 
 impl LazyIter<HeapValue> for MapIterNativeHeap<Value> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<HeapValue> {
         match self.iter.next() {
             None => None,
@@ -271,6 +320,9 @@ impl LazyIter<HeapValue> for MapIterNativeHeap<Value> {
 }
 
 impl LazyIter<HeapValue> for MapIterNativeHeap<HeapValue> {
+    fn size_hint(&self) -> Option<usize> {
+        LazyIter::size_hint(self.iter.as_ref())
+    }
     fn next(&mut self) -> Option<HeapValue> {
         match self.iter.next() {
             None => None,
@@ -387,37 +439,40 @@ impl LazyIter<HeapValue> for FilterIter<HeapValue> {
 pub struct ZipIter {
     iters: Vec<Box<dyn LazyIter<Value>>>,
     heap_iters: Vec<Box<dyn LazyIter<HeapValue>>>,
-    closure: Box<Closure>,
+    closure: Rc<Closure>,
     vm: *mut VM,
 }
 
 impl ZipIter {
-    pub fn new(iters: Vec<Box<dyn LazyIter<Value>>>, heap_iters: Vec<Box<dyn LazyIter<HeapValue>>>, closure: Box<Closure>, vm: *mut VM) -> Self {
+    pub fn new(iters: Vec<Box<dyn LazyIter<Value>>>, heap_iters: Vec<Box<dyn LazyIter<HeapValue>>>, closure: Rc<Closure>, vm: *mut VM) -> Self {
         Self { iters, heap_iters, closure, vm }
     }
 
     fn _next(&mut self) -> Option<()> {
         let vm = unsafe { &mut *self.vm };
-        let mut stack_values = Vec::new();
-        let mut heap_stack_values = Vec::new();
+        // push each element straight onto the VM's stacks; if any source runs
+        // out, roll back to the recorded lengths instead of building temp Vecs
+        let stack_len = vm.stack.len();
+        let heap_stack_len = vm.heap_stack.len();
         for iter in self.iters.iter_mut().rev() {
             match iter.next() {
-                None => return None,
-                Some(x) => {
-                    stack_values.push(x);
-                }
+                None => {
+                    vm.stack.truncate(stack_len);
+                    return None;
+                },
+                Some(x) => vm.stack.push(x),
             }
         }
         for iter in self.heap_iters.iter_mut().rev() {
             match iter.next() {
-                None => return None,
-                Some(x) => {
-                    heap_stack_values.push(x);
-                }
+                None => {
+                    vm.stack.truncate(stack_len);
+                    vm.heap_stack.truncate(heap_stack_len);
+                    return None;
+                },
+                Some(x) => vm.heap_stack.push(x),
             }
         }
-        vm.stack.append(&mut stack_values);
-        vm.heap_stack.append(&mut heap_stack_values);
         vm.call_function(self.closure.clone()).expect("Unrecoverable error in zip iterator");
         Some(())
     }
@@ -455,26 +510,29 @@ impl ZipIterNative {
 
     fn _next(&mut self) -> Option<()> {
         let vm = unsafe { &mut *self.vm };
-        let mut stack_values = Vec::new();
-        let mut heap_stack_values = Vec::new();
+        // push each element straight onto the VM's stacks; if any source runs
+        // out, roll back to the recorded lengths instead of building temp Vecs
+        let stack_len = vm.stack.len();
+        let heap_stack_len = vm.heap_stack.len();
         for iter in self.iters.iter_mut().rev() {
             match iter.next() {
-                None => return None,
-                Some(x) => {
-                    stack_values.push(x);
-                }
+                None => {
+                    vm.stack.truncate(stack_len);
+                    return None;
+                },
+                Some(x) => vm.stack.push(x),
             }
         }
         for iter in self.heap_iters.iter_mut().rev() {
             match iter.next() {
-                None => return None,
-                Some(x) => {
-                    heap_stack_values.push(x);
-                }
+                None => {
+                    vm.stack.truncate(stack_len);
+                    vm.heap_stack.truncate(heap_stack_len);
+                    return None;
+                },
+                Some(x) => vm.heap_stack.push(x),
             }
         }
-        vm.stack.append(&mut stack_values);
-        vm.heap_stack.append(&mut heap_stack_values);
         vm.call_native_function(self.function).expect("Unrecoverable error in zip iterator");
         Some(())
     }
@@ -514,26 +572,29 @@ impl ZipIterTypeDef {
 impl LazyIter<HeapValue> for ZipIterTypeDef {
     fn next(&mut self) -> Option<HeapValue> {
         let vm = unsafe { &mut *self.vm };
-        let mut stack_values = Vec::new();
-        let mut heap_stack_values = Vec::new();
+        // push each element straight onto the VM's stacks; if any source runs
+        // out, roll back to the recorded lengths instead of building temp Vecs
+        let stack_len = vm.stack.len();
+        let heap_stack_len = vm.heap_stack.len();
         for iter in self.iters.iter_mut().rev() {
             match iter.next() {
-                None => return None,
-                Some(x) => {
-                    stack_values.push(x);
-                }
+                None => {
+                    vm.stack.truncate(stack_len);
+                    return None;
+                },
+                Some(x) => vm.stack.push(x),
             }
         }
         for iter in self.heap_iters.iter_mut().rev() {
             match iter.next() {
-                None => return None,
-                Some(x) => {
-                    heap_stack_values.push(x);
-                }
+                None => {
+                    vm.stack.truncate(stack_len);
+                    vm.heap_stack.truncate(heap_stack_len);
+                    return None;
+                },
+                Some(x) => vm.heap_stack.push(x),
             }
         }
-        vm.stack.append(&mut stack_values);
-        vm.heap_stack.append(&mut heap_stack_values);
         vm.create_object(self.typedef.clone()).expect("Unrecoverable error in zip iterator");
         vm.heap_stack.pop()
     }
@@ -6,7 +6,9 @@ use super::{HeapValue, Value};
 
 pub struct TypeDef {
     pub name: String,
-    pub fields: Vec<(String, bool)>,
+    // field names are shared Rc<str>s so instantiating an object only bumps
+    // refcounts instead of copying each name
+    pub fields: Vec<(Rc<str>, bool)>,
 }
 
 impl Debug for TypeDef {
@@ -36,15 +38,15 @@ impl Display for TypeDef {
 }
 
 impl TypeDef {
-    pub fn new(name: String, fields: Vec<(String, bool)>) -> Self {
+    pub fn new(name: String, fields: Vec<(Rc<str>, bool)>) -> Self {
         Self { name, fields }
     }
 }
 
 pub struct Object {
     pub typedef: Rc<TypeDef>,
-    pub fields: FxHashMap<String, Value>,
-    pub heap_fields: FxHashMap<String, HeapValue>,
+    pub fields: FxHashMap<Rc<str>, Value>,
+    pub heap_fields: FxHashMap<Rc<str>, HeapValue>,
 }
 
 impl Debug for Object {
@@ -59,7 +61,7 @@ impl Debug for Object {
 }
 
 impl Object {
-    pub fn new(typedef: Rc<TypeDef>, fields: FxHashMap<String, Value>, heap_fields: FxHashMap<String, HeapValue>) -> Self {
+    pub fn new(typedef: Rc<TypeDef>, fields: FxHashMap<Rc<str>, Value>, heap_fields: FxHashMap<Rc<str>, HeapValue>) -> Self {
         Self { typedef, fields, heap_fields }
     }
 }
\ No newline at end of file
@@ -15,7 +15,7 @@ pub enum TaggedValue {
     Str(String),
     Arr(Vec<TaggedValue>),
     Maybe(Option<Box<TaggedValue>>),
-    Closure(Box<Closure>),
+    Closure(Rc<Closure>),
     TypeDef(Rc<TypeDef>),
     Object(String, FxHashMap<String, TaggedValue>),
 }
@@ -25,14 +25,14 @@ impl std::fmt::Display for InterpreterError {
 }
 
 pub struct CallFrame {
-    closure: Box<Closure>,
+    closure: Rc<Closure>,
     ip: usize,
     stack_idx: usize,
     heap_stack_idx: usize,
 }
 
 impl CallFrame {
-    fn new(closure: Box<Closure>, stack_idx: usize, heap_stack_idx: usize) -> Self {
+    fn new(closure: Rc<Closure>, stack_idx: usize, heap_stack_idx: usize) -> Self {
         Self { closure, ip: 0, stack_idx, heap_stack_idx }
     }
 }
@@ -40,8 +40,8 @@ impl CallFrame {
 pub struct VM {
     pub stack: Vec<Value>,
     pub heap_stack: Vec<HeapValue>,
-    pub globals: FxHashMap<String, Value>,
-    pub heap_globals: FxHashMap<String, HeapValue>,
+    pub globals: FxHashMap<Rc<str>, Value>,
+    pub heap_globals: FxHashMap<Rc<str>, HeapValue>,
     pub frames: Vec<CallFrame>,
     pub typecontext: compiler::TypeContext,
 }
@@ -49,17 +49,19 @@ pub struct VM {
 impl VM {
     pub fn new() -> Self {
         Self {
-            stack: Vec::new(),
-            heap_stack: Vec::new(),
+            // start with enough room that typical programs never regrow
+            // the stacks or the frame list mid-run
+            stack: Vec::with_capacity(1024),
+            heap_stack: Vec::with_capacity(256),
             globals: builtins::builtins(),
             heap_globals: builtins::heap_builtins(),
-            frames: Vec::new(),
+            frames: Vec::with_capacity(64),
             typecontext: Rc::new(RefCell::new(builtins::builtin_types())),
         }
     }
 
     fn init(&mut self, function: Rc<Function>) {
-        let closure = Box::new(Closure::new(function));
+        let closure = Rc::new(Closure::new(function));
         let frame = CallFrame::new(closure, 0, 0);
         self.frames.push(frame);
     }
@@ -70,25 +72,23 @@ impl VM {
     fn frame_mut(&mut self) -> &mut CallFrame {
         self.frames.last_mut().unwrap()
     }
-    fn frame_ptr(&mut self) -> *mut CallFrame {
-        self.frames.last_mut().unwrap()
-    }
-
+    // the read helpers borrow the chunk and ip out of the same frame lookup,
+    // so each bytecode read touches the frame list once
     fn read_u8(&mut self) -> u8 {
-        let ip = unsafe { &mut (*self.frame_ptr()).ip };
-        self.chunk().read_u8(ip)
+        let frame = self.frames.last_mut().unwrap();
+        frame.closure.function.chunk.read_u8(&mut frame.ip)
     }
     fn read_u16(&mut self) -> u16 {
-        let ip = unsafe { &mut (*self.frame_ptr()).ip };
-        self.chunk().read_u16(ip)
+        let frame = self.frames.last_mut().unwrap();
+        frame.closure.function.chunk.read_u16(&mut frame.ip)
     }
     fn read_constant(&mut self) -> Value {
-        let ip = unsafe { &mut (*self.frame_ptr()).ip };
-        self.chunk().read_constant(ip)
+        let frame = self.frames.last_mut().unwrap();
+        frame.closure.function.chunk.read_constant(&mut frame.ip)
     }
     fn read_heap_constant(&mut self) -> &HeapValue {
-        let ip = unsafe { &mut (*self.frame_ptr()).ip };
-        self.chunk().read_heap_constant(ip)
+        let frame = self.frames.last_mut().unwrap();
+        frame.closure.function.chunk.read_heap_constant(&mut frame.ip)
     }
 
     pub fn chunk(&self) -> &Chunk {
@@ -105,55 +105,65 @@ impl VM {
         InterpreterError::RuntimeError(e.to_string())
     }
 
-    fn binary_bool_op(&mut self, op: fn(bool, bool) -> bool) {
+    fn binary_bool_op(&mut self, op: impl Fn(bool, bool) -> bool) {
         let r = self.stack.pop().expect("Attempted to perform binary operation with empty stack");
         let l = self.stack.pop().expect("Attempted to perform binary operation without enough values on the stack");
         let (l, r) = unsafe { (l.b, r.b) };
         self.stack.push(Value { b: op(l, r) });
     }
-    fn unary_bool_op(&mut self, op: fn(bool) -> bool) {
+    fn unary_bool_op(&mut self, op: impl Fn(bool) -> bool) {
         let r = self.stack.pop().expect("Attempted to perform unary operation with empty stack");
         let r = unsafe { r.b };
         self.stack.push(Value { b: op(r) });
     }
 
-    fn binary_int_comp(&mut self, op: fn(&i64, &i64) -> bool) {
+    fn binary_int_comp(&mut self, op: impl Fn(&i64, &i64) -> bool) {
         let r = self.stack.pop().expect("Attempted to perform binary comparison with empty stack");
         let l = self.stack.pop().expect("Attempted to perform binary comparison without enough values on the stack");
         let (l, r) = unsafe { (l.i, r.i) };
         self.stack.push(Value { b: op(&l, &r) });
     }
-    fn binary_int_op(&mut self, op: fn(i64, i64) -> i64) {
+    fn binary_int_op(&mut self, op: impl Fn(i64, i64) -> i64) {
         let r = self.stack.pop().expect("Attempted to perform binary operation with empty stack");
         let l = self.stack.pop().expect("Attempted to perform binary operation without enough values on the stack");
         let (l, r) = unsafe { (l.i, r.i) };
         self.stack.push(Value { i: op(l, r) });
     }
-    fn unary_int_op(&mut self, op: fn(i64) -> i64) {
+    fn binary_int_const_op(&mut self, constant: Value, op: impl Fn(i64, i64) -> i64) {
+        let l = self.stack.pop().expect("Attempted to perform binary operation with empty stack");
+        let (l, r) = unsafe { (l.i, constant.i) };
+        self.stack.push(Value { i: op(l, r) });
+    }
+    fn binary_int_const_comp(&mut self, constant: Value, op: impl Fn(i64, i64) -> bool) {
+        let l = self.stack.pop().expect("Attempted to perform binary comparison with empty stack");
+        let (l, r) = unsafe { (l.i, constant.i) };
+        self.stack.push(Value { b: op(l, r) });
+    }
+    fn unary_int_op(&mut self, op: impl Fn(i64) -> i64) {
         let r = self.stack.pop().expect("Attempted to perform unary operation with empty stack");
         let r = unsafe { r.i };
         self.stack.push(Value { i: op(r) });
     }
 
-    fn binary_float_comp(&mut self, op: fn(&f64, &f64) -> bool) {
+    fn binary_float_comp(&mut self, op: impl Fn(&f64, &f64) -> bool) {
         let r = self.stack.pop().expect("Attempted to perform binary comparison with empty stack");
         let l = self.stack.pop().expect("Attempted to perform binary comparison without enough values on the stack");
         let (l, r) = unsafe { (l.f, r.f) };
         self.stack.push(Value { b: op(&l, &r) });
     }
-    fn binary_float_op(&mut self, op: fn(f64, f64) -> f64) {
+    fn binary_float_op(&mut self, op: impl Fn(f64, f64) -> f64) {
         let r = self.stack.pop().expect("Attempted to perform binary operation with empty stack");
         let l = self.stack.pop().expect("Attempted to perform binary operation without enough values on the stack");
         let (l, r) = unsafe { (l.f, r.f) };
         self.stack.push(Value { f: op(l, r) });
     }
-    fn unary_float_op(&mut self, op: fn(f64) -> f64) {
+    fn unary_float_op(&mut self, op: impl Fn(f64) -> f64) {
         let r = self.stack.pop().expect("Attempted to perform unary operation with empty stack");
         let r = unsafe { r.f };
         self.stack.push(Value { f: op(r) });
     }
 
-    pub fn call_function(&mut self, closure: Box<Closure>) -> Result<(), InterpreterError> {
+    pub fn call_function(&mut self, closure: Rc<Closure>) -> Result<(), InterpreterError> {
         let n_args = closure.function.arity as usize;
         let n_heap_args = closure.function.heap_arity as usize;
         let is_heap = closure.function.return_is_heap;
@@ -180,9 +190,7 @@ impl VM {
     }
 
     pub fn call_native_function(&mut self, function: &'static NativeFunction) -> Result<(), InterpreterError> {
-        let args = self.stack.split_off(self.stack.len() - function.arity as usize);
-        let heap_args = self.heap_stack.split_off(self.heap_stack.len() - function.heap_arity as usize);
-        (function.function)(self, &args, &heap_args)
+        (function.function)(self)
     }
 
     fn get_idx(&mut self, arr_len: usize) -> Result<i64, InterpreterError> {
@@ -214,14 +222,14 @@ impl VM {
     pub fn create_object(&mut self, typedef: Rc<TypeDef>) -> Result<(), InterpreterError> {
         let mut fields = FxHashMap::default();
         let mut heap_fields = FxHashMap::default();
-        for (fieldname, is_heap) in typedef.fields.iter().cloned().rev() {
-            if is_heap {
+        for (fieldname, is_heap) in typedef.fields.iter().rev() {
+            if *is_heap {
                 let value = self.heap_stack.pop().expect("Call to create_object resulted in empty stack");
-                heap_fields.insert(fieldname, value);
+                heap_fields.insert(fieldname.clone(), value);
             }
             else {
                 let value = self.stack.pop().expect("Call to create_object resulted in empty stack");
-                fields.insert(fieldname, value);
+                fields.insert(fieldname.clone(), value);
             }
         }
         let obj = Object::new(typedef, fields, heap_fields);
@@ -441,6 +449,26 @@ impl VM {
                 OpCode::IntMultiply => self.binary_int_op(i64::mul),
                 OpCode::IntDivide => self.binary_int_op(i64::div),
                 OpCode::IntNegate => self.unary_int_op(i64::neg),
+                OpCode::IntAddConstant => {
+                    let c = self.read_constant();
+                    self.binary_int_const_op(c, |l, r| l + r);
+                },
+                OpCode::IntSubtractConstant => {
+                    let c = self.read_constant();
+                    self.binary_int_const_op(c, |l, r| l - r);
+                },
+                OpCode::IntMultiplyConstant => {
+                    let c = self.read_constant();
+                    self.binary_int_const_op(c, |l, r| l * r);
+                },
+                OpCode::IntEqualConstant => {
+                    let c = self.read_constant();
+                    self.binary_int_const_comp(c, |l, r| l == r);
+                },
+                OpCode::IntLessConstant => {
+                    let c = self.read_constant();
+                    self.binary_int_const_comp(c, |l, r| l < r);
+                },
                 OpCode::To => {
                     let r = self.stack.pop().expect("Expected int on stack");
                     let l = self.stack.pop().expect("Expected int on stack");
@@ -578,7 +606,7 @@ impl VM {
                 OpCode::SetGlobal => {
                     let name = self.read_heap_constant();
                     let name = match name {
-                        HeapValue::String(name) => name.as_ref().clone(),
+                        HeapValue::String(name) => name.clone(),
                         _ => unreachable!("Global name was not a string"),
                     };
                     let value = match self.stack.last() {
@@ -590,7 +618,7 @@ impl VM {
                 OpCode::SetHeapGlobal => {
                     let name = self.read_heap_constant();
                     let name = match name {
-                        HeapValue::String(name) => name.as_ref().clone(),
+                        HeapValue::String(name) => name.clone(),
                         _ => unreachable!("Global name was not a string"),
                     };
                     let value = match self.heap_stack.last() {
@@ -606,7 +634,9 @@ impl VM {
                     };
                     match self.globals.get(name.as_ref()) {
                         Some(x) => self.stack.push(*x),
-                        None => unreachable!("Attempted to get global {} that does not exist", name),
+                        None => return Err(self.runtime_err(
+                            format!("Global variable '{}' is not defined", name)
+                        )),
                     };
                 },
                 OpCode::GetHeapGlobal => {
@@ -616,7 +646,9 @@ impl VM {
                     };
                     match self.heap_globals.get(name.as_ref()) {
                         Some(x) => self.heap_stack.push(x.clone()),
-                        None => unreachable!("Attempted to get global {} that does not exist", name),
+                        None => return Err(self.runtime_err(
+                            format!("Global variable '{}' is not defined", name)
+                        )),
                     };
                 }
                 OpCode::SetLocal => {
@@ -644,8 +676,11 @@ impl VM {
                     self.heap_stack.push(value);
                 },
                 OpCode::Closure => {
+                    // clone the template closure out of its Rc so the
+                    // captured upvalues can be filled in, then wrap the result
+                    // in a fresh Rc; later calls only bump the refcount
                     let mut closure = match self.read_heap_constant() {
-                        HeapValue::Closure(c) => c.clone(),
+                        HeapValue::Closure(c) => Closure::clone(c),
                         _ => unreachable!("Closure was not a function"),
                     };
                     for _ in 0..closure.function.num_upvalues {
@@ -672,7 +707,7 @@ impl VM {
                             }
                         )
                     }
-                    self.heap_stack.push(HeapValue::Closure(closure));
+                    self.heap_stack.push(HeapValue::Closure(Rc::new(closure)));
                 },
                 OpCode::GetUpvalue => {
                     let idx = self.read_u16();
@@ -924,7 +959,7 @@ fn unpack_heapvalue(hvalue: HeapValue, return_type: &ast::Type) -> Result<Tagged
             unpack_heapvalue(HeapValue::ArrayHeap(arr), &ast::Type::Arr(typ.clone()))
         },
         (HeapValue::String(s), ast::Type::Str) => {
-            Ok(TaggedValue::Str(s.as_ref().clone()))
+            Ok(TaggedValue::Str(s.as_ref().to_string()))
         },
         (HeapValue::Maybe(x), ast::Type::Maybe(typ)) => {
             TaggedValue::from_maybe(x, typ.as_ref())
@@ -944,7 +979,7 @@ fn unpack_heapvalue(hvalue: HeapValue, return_type: &ast::Type) -> Result<Tagged
                             HeapValue::String(s) => s,
                             _ => unreachable!()
                         };
-                        arr_s.push(TaggedValue::Str(s.as_ref().clone()));
+                        arr_s.push(TaggedValue::Str(s.as_ref().to_string()));
                     }
                     Ok(TaggedValue::Arr(arr_s))
                 },
@@ -972,14 +1007,14 @@ fn unpack_heapvalue(hvalue: HeapValue, return_type: &ast::Type) -> Result<Tagged
             }).cloned());
             let mut fields = FxHashMap::default();
             for (n, v) in obj.fields.iter() {
-                let t = nonheap_fields.get(n).unwrap();
+                let t = nonheap_fields.get(n.as_ref()).unwrap();
                 let x = TaggedValue::from_value(*v, t)?;
-                fields.insert(n.clone(), x);
+                fields.insert(n.to_string(), x);
             }
             for (n, v) in obj.heap_fields.iter() {
-                let t = heap_fields.get(n).unwrap();
+                let t = heap_fields.get(n.as_ref()).unwrap();
                 let x = unpack_heapvalue(v.clone(), t)?;
-                fields.insert(n.clone(), x);
+                fields.insert(n.to_string(), x);
             }
 
             Ok(TaggedValue::Object(name.clone(), fields))
@@ -1,4 +1,4 @@
-use lazy_static::lazy_static;
+use std::sync::LazyLock;
 use rustc_hash::FxHashMap;
 
 use super::wasmtypes::*;
@@ -160,326 +160,324 @@ impl BuiltinFunc {
     }
 }
 
-lazy_static! {
-    pub static ref BUILTINS: FxHashMap<String, BuiltinFunc> = {
-        let mut map = FxHashMap::default();
-
-        // TODO: allow this to grow to more pages and raise error if out of memory
-        let alloc = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I32], Some(Numtype::I32)),
-                vec!["size".to_string()]
-            );
-    
-            func.add_local("offset", Numtype::I32);
-    
-            // get memptr (start of next memory chunk)
-            func.write_opcode(Opcode::GlobalGet);
-            func.write_byte(0x00);
-            func.write_opcode(Opcode::LocalSet);
-            func.write_var("offset");  // save_location as value to return
-    
-            // set memptr to end of new memory chunk (memptr = memptr + size)
-            func.write_opcode(Opcode::GlobalGet);
-            func.write_byte(0x00);
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("size");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::GlobalSet);
-            func.write_byte(0x00);
-    
-            // return start of the new memory chunk
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("offset");
-    
-            func.write_opcode(Opcode::End);
-    
-            func
-        };
-        map.insert("alloc".to_string(), alloc);
-    
-        // let free = {
-        //     let mut func = BuiltinFunc::new(
-        //         FuncTypeSignature::default(),
-        //         vec![]
-        //     );
-    
-        //     // memptr = memptr - (*memptr + 4)
-        //     // get memptr
-        //     func.write_opcode(Opcode::GlobalGet);
-        //     func.write_byte(0x00);
-        //     // load *memptr
-        //     func.write_opcode(Opcode::GlobalGet);
-        //     func.write_byte(0x00);
-        //     func.write_opcode(Opcode::I32Load);
-        //     func.write_byte(0x02);  // alignment
-        //     func.write_byte(0x00);  // load offset
-        //     // + 4
-        //     func.write_opcode(Opcode::I32Const);
-        //     func.write_byte(0x04);
-        //     func.write_opcode(Opcode::I32Add);
-        //     // - (*memptr + 4)
-        //     func.write_opcode(Opcode::I32Sub);
-        //     // set memptr
-        //     func.write_opcode(Opcode::GlobalSet);
-        //     func.write_byte(0x00);
-    
-        //     func.write_opcode(Opcode::End);
-    
-        //     func
-        // };
-        // map.insert("free".to_string(), free);
-
-        let copy_heap_obj = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I64], Some(Numtype::I64)),
-                vec!["fatptr".to_string()]
-            );
-
-            func.add_local("offset", Numtype::I32);
-            func.add_local("size", Numtype::I32);
-
-            func.set_offset_and_size("fatptr", "offset", "size");
-            func.copy_mem("offset", "size");
-
-            func.align_memptr();
-
-            // return [offset, size]
-            func.create_fatptr("offset", "size");
-
-            func.write_opcode(Opcode::End);
-
-            func
-        };
-        map.insert("copy_heap_obj".to_string(), copy_heap_obj);
-
-        let concat_heap_objs = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I64, Numtype::I64], Some(Numtype::I64)),
-                vec!["fatptr1".to_string(), "fatptr2".to_string()]
-            );
-
-            func.add_local("offset1", Numtype::I32);
-            func.add_local("size1", Numtype::I32);
-            func.add_local("offset2", Numtype::I32);
-            func.add_local("size2", Numtype::I32);
-
-            func.set_offset_and_size("fatptr1", "offset1", "size1");
-            func.set_offset_and_size("fatptr2", "offset2", "size2");
-
-            func.copy_mem("offset1", "size1");
-            func.copy_mem("offset2", "size2");
-
-            func.align_memptr();
-
-            // return [offset1, size1 + size2]
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("offset1");
-            func.write_opcode(Opcode::I64ExtendI32U);
-            func.write_opcode(Opcode::I64Const);
-            func.write_byte(0x20);
-            func.write_opcode(Opcode::I64Shl);
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("size1");
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("size2");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::I64ExtendI32U);
-            func.write_opcode(Opcode::I64Add);
-
-            func.write_opcode(Opcode::End);
-
-            func
-        };
-        map.insert("concat_heap_objs".to_string(), concat_heap_objs);
-
-        let heap_objs_equal = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I64, Numtype::I64], Some(Numtype::I32)),
-                vec!["fatptr1".to_string(), "fatptr2".to_string()]
-            );
-
-            func.add_local("offset1", Numtype::I32);
-            func.add_local("size1", Numtype::I32);
-            func.add_local("offset2", Numtype::I32);
-            func.add_local("size2", Numtype::I32);
-
-            func.set_offset_and_size("fatptr1", "offset1", "size1");
-            func.set_offset_and_size("fatptr2", "offset2", "size2");
-
-            // check if sizes are equal
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("size1");
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("size2");
-            func.write_opcode(Opcode::I32Eq);
-            func.write_opcode(Opcode::If);
-            func.write_byte(Numtype::I32 as u8);  // will be 1 if equal, 0 if not
-
-            // case if sizes are equal
-            // loop through all values and check if they are equal
-            // <inner_offset> is used to store the index of the current value within the loop
-            func.add_local("inner_offset", Numtype::I32);
-            func.write_opcode(Opcode::I32Const);
-            func.write_byte(0x00);
-            func.write_opcode(Opcode::LocalSet);
-            func.write_var("inner_offset");
-            // <equal> is used to store whether the values are equal, initialized to 1
-            func.add_local("equal", Numtype::I32);
-            func.write_opcode(Opcode::I32Const);
-            func.write_byte(0x01);
-            func.write_opcode(Opcode::LocalSet);
-            func.write_var("equal");
-            func.write_opcode(Opcode::Loop);
-            func.write_byte(Numtype::Void as u8);
-            // read value from memory at offset1 + inner_offset
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("inner_offset");
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("offset1");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::I32Load);
-            func.write_byte(0x02);  // alignment
-            func.write_byte(0x00);  // load offset
-            // read value from memory at offset2 + inner_offset
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("inner_offset");
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("offset2");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::I32Load);
-            func.write_byte(0x02);  // alignment
-            func.write_byte(0x00);  // load offset
-            // compare values, update equal, keep that value on stack
-            func.write_opcode(Opcode::I32Eq);
-            func.write_opcode(Opcode::LocalTee);
-            func.write_var("equal");
-            // add 4 to inner_offset
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("inner_offset");
-            func.write_opcode(Opcode::I32Const);
-            func.write_byte(0x04);
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::LocalTee);
-            func.write_var("inner_offset");
-            // check if inner_offset < size1
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("size1");
-            func.write_opcode(Opcode::I32LtU);
-            // continue if inner_offset < size1 AND equal == 1
-            func.write_opcode(Opcode::I32And);
-            func.write_opcode(Opcode::BrIf);
-            func.write_byte(0x00);  // break depth
-            func.write_opcode(Opcode::End); // end loop
-            // return <equal>
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("equal");
-
-
-            func.write_opcode(Opcode::Else);
-            // case if sizes are not equal
-            func.write_opcode(Opcode::I32Const);
-            func.write_byte(0);
-
-
-            func.write_opcode(Opcode::End); // end if
-
-            func.write_opcode(Opcode::End); // end function
-
-            func
-        };
-        map.insert("heap_objs_equal".to_string(), heap_objs_equal);
-
-        let get_i32_field = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I64, Numtype::I32], Some(Numtype::I32)),
-                vec!["obj".to_string(), "field_offset".to_string()]
-            );
-            func.add_local("obj_offset", Numtype::I32);
-            
-            // obj_offset = obj >> 32
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("obj");
-            func.write_opcode(Opcode::I64Const);
-            func.write_byte(0x20);
-            func.write_opcode(Opcode::I64ShrU);
-            func.write_opcode(Opcode::I32WrapI64);
-            func.write_opcode(Opcode::LocalTee);
-            func.write_var("obj_offset");
-            // read i32 at obj_offset + field_offset
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("field_offset");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::I32Load);
-            func.write_byte(0x02);  // alignment
-            func.write_byte(0x00);  // load offset
-
-            func.write_opcode(Opcode::End);
-
-            func
-        };
-        map.insert("get_i32_field".to_string(), get_i32_field);
-
-        let get_f32_field = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I64, Numtype::I32], Some(Numtype::F32)),
-                vec!["obj".to_string(), "field_offset".to_string()]
-            );
-            func.add_local("obj_offset", Numtype::I32);
-            
-            // obj_offset = obj >> 32
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("obj");
-            func.write_opcode(Opcode::I64Const);
-            func.write_byte(0x20);
-            func.write_opcode(Opcode::I64ShrU);
-            func.write_opcode(Opcode::I32WrapI64);
-            func.write_opcode(Opcode::LocalTee);
-            func.write_var("obj_offset");
-            // read i32 at obj_offset + field_offset
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("field_offset");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::F32Load);
-            func.write_byte(0x02);  // alignment
-            func.write_byte(0x00);  // load offset
-
-            func.write_opcode(Opcode::End);
-
-            func
-        };
-        map.insert("get_f32_field".to_string(), get_f32_field);
-
-        let get_i64_field = {
-            let mut func = BuiltinFunc::new(
-                FuncTypeSignature::new(vec![Numtype::I64, Numtype::I32], Some(Numtype::I64)),
-                vec!["obj".to_string(), "field_offset".to_string()]
-            );
-            func.add_local("obj_offset", Numtype::I32);
-            
-            // obj_offset = obj >> 32
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("obj");
-            func.write_opcode(Opcode::I64Const);
-            func.write_byte(0x20);
-            func.write_opcode(Opcode::I64ShrU);
-            func.write_opcode(Opcode::I32WrapI64);
-            func.write_opcode(Opcode::LocalTee);
-            func.write_var("obj_offset");
-            // read i64 at obj_offset + field_offset
-            func.write_opcode(Opcode::LocalGet);
-            func.write_var("field_offset");
-            func.write_opcode(Opcode::I32Add);
-            func.write_opcode(Opcode::I64Load);
-            func.write_byte(0x02);  // alignment
-            func.write_byte(0x00);  // load offset
-
-            func.write_opcode(Opcode::End);
-
-            func
-        };
-        map.insert("get_i64_field".to_string(), get_i64_field);
-
-        map
+pub static BUILTINS: LazyLock<FxHashMap<String, BuiltinFunc>> = LazyLock::new(|| {
+    let mut map = FxHashMap::default();
+
+    // TODO: allow this to grow to more pages and raise error if out of memory
+    let alloc = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I32], Some(Numtype::I32)),
+            vec!["size".to_string()]
+        );
+
+        func.add_local("offset", Numtype::I32);
+
+        // get memptr (start of next memory chunk)
+        func.write_opcode(Opcode::GlobalGet);
+        func.write_byte(0x00);
+        func.write_opcode(Opcode::LocalSet);
+        func.write_var("offset");  // save_location as value to return
+
+        // set memptr to end of new memory chunk (memptr = memptr + size)
+        func.write_opcode(Opcode::GlobalGet);
+        func.write_byte(0x00);
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("size");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::GlobalSet);
+        func.write_byte(0x00);
+
+        // return start of the new memory chunk
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("offset");
+
+        func.write_opcode(Opcode::End);
+
+        func
     };
-}
\ No newline at end of file
+    map.insert("alloc".to_string(), alloc);
+
+    // let free = {
+    //     let mut func = BuiltinFunc::new(
+    //         FuncTypeSignature::default(),
+    //         vec![]
+    //     );
+
+    //     // memptr = memptr - (*memptr + 4)
+    //     // get memptr
+    //     func.write_opcode(Opcode::GlobalGet);
+    //     func.write_byte(0x00);
+    //     // load *memptr
+    //     func.write_opcode(Opcode::GlobalGet);
+    //     func.write_byte(0x00);
+    //     func.write_opcode(Opcode::I32Load);
+    //     func.write_byte(0x02);  // alignment
+    //     func.write_byte(0x00);  // load offset
+    //     // + 4
+    //     func.write_opcode(Opcode::I32Const);
+    //     func.write_byte(0x04);
+    //     func.write_opcode(Opcode::I32Add);
+    //     // - (*memptr + 4)
+    //     func.write_opcode(Opcode::I32Sub);
+    //     // set memptr
+    //     func.write_opcode(Opcode::GlobalSet);
+    //     func.write_byte(0x00);
+
+    //     func.write_opcode(Opcode::End);
+
+    //     func
+    // };
+    // map.insert("free".to_string(), free);
+
+    let copy_heap_obj = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I64], Some(Numtype::I64)),
+            vec!["fatptr".to_string()]
+        );
+
+        func.add_local("offset", Numtype::I32);
+        func.add_local("size", Numtype::I32);
+
+        func.set_offset_and_size("fatptr", "offset", "size");
+        func.copy_mem("offset", "size");
+
+        func.align_memptr();
+
+        // return [offset, size]
+        func.create_fatptr("offset", "size");
+
+        func.write_opcode(Opcode::End);
+
+        func
+    };
+    map.insert("copy_heap_obj".to_string(), copy_heap_obj);
+
+    let concat_heap_objs = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I64, Numtype::I64], Some(Numtype::I64)),
+            vec!["fatptr1".to_string(), "fatptr2".to_string()]
+        );
+
+        func.add_local("offset1", Numtype::I32);
+        func.add_local("size1", Numtype::I32);
+        func.add_local("offset2", Numtype::I32);
+        func.add_local("size2", Numtype::I32);
+
+        func.set_offset_and_size("fatptr1", "offset1", "size1");
+        func.set_offset_and_size("fatptr2", "offset2", "size2");
+
+        func.copy_mem("offset1", "size1");
+        func.copy_mem("offset2", "size2");
+
+        func.align_memptr();
+
+        // return [offset1, size1 + size2]
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("offset1");
+        func.write_opcode(Opcode::I64ExtendI32U);
+        func.write_opcode(Opcode::I64Const);
+        func.write_byte(0x20);
+        func.write_opcode(Opcode::I64Shl);
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("size1");
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("size2");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::I64ExtendI32U);
+        func.write_opcode(Opcode::I64Add);
+
+        func.write_opcode(Opcode::End);
+
+        func
+    };
+    map.insert("concat_heap_objs".to_string(), concat_heap_objs);
+
+    let heap_objs_equal = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I64, Numtype::I64], Some(Numtype::I32)),
+            vec!["fatptr1".to_string(), "fatptr2".to_string()]
+        );
+
+        func.add_local("offset1", Numtype::I32);
+        func.add_local("size1", Numtype::I32);
+        func.add_local("offset2", Numtype::I32);
+        func.add_local("size2", Numtype::I32);
+
+        func.set_offset_and_size("fatptr1", "offset1", "size1");
+        func.set_offset_and_size("fatptr2", "offset2", "size2");
+
+        // check if sizes are equal
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("size1");
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("size2");
+        func.write_opcode(Opcode::I32Eq);
+        func.write_opcode(Opcode::If);
+        func.write_byte(Numtype::I32 as u8);  // will be 1 if equal, 0 if not
+
+        // case if sizes are equal
+        // loop through all values and check if they are equal
+        // <inner_offset> is used to store the index of the current value within the loop
+        func.add_local("inner_offset", Numtype::I32);
+        func.write_opcode(Opcode::I32Const);
+        func.write_byte(0x00);
+        func.write_opcode(Opcode::LocalSet);
+        func.write_var("inner_offset");
+        // <equal> is used to store whether the values are equal, initialized to 1
+        func.add_local("equal", Numtype::I32);
+        func.write_opcode(Opcode::I32Const);
+        func.write_byte(0x01);
+        func.write_opcode(Opcode::LocalSet);
+        func.write_var("equal");
+        func.write_opcode(Opcode::Loop);
+        func.write_byte(Numtype::Void as u8);
+        // read value from memory at offset1 + inner_offset
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("inner_offset");
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("offset1");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::I32Load);
+        func.write_byte(0x02);  // alignment
+        func.write_byte(0x00);  // load offset
+        // read value from memory at offset2 + inner_offset
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("inner_offset");
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("offset2");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::I32Load);
+        func.write_byte(0x02);  // alignment
+        func.write_byte(0x00);  // load offset
+        // compare values, update equal, keep that value on stack
+        func.write_opcode(Opcode::I32Eq);
+        func.write_opcode(Opcode::LocalTee);
+        func.write_var("equal");
+        // add 4 to inner_offset
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("inner_offset");
+        func.write_opcode(Opcode::I32Const);
+        func.write_byte(0x04);
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::LocalTee);
+        func.write_var("inner_offset");
+        // check if inner_offset < size1
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("size1");
+        func.write_opcode(Opcode::I32LtU);
+        // continue if inner_offset < size1 AND equal == 1
+        func.write_opcode(Opcode::I32And);
+        func.write_opcode(Opcode::BrIf);
+        func.write_byte(0x00);  // break depth
+        func.write_opcode(Opcode::End); // end loop
+        // return <equal>
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("equal");
+
+
+        func.write_opcode(Opcode::Else);
+        // case if sizes are not equal
+        func.write_opcode(Opcode::I32Const);
+        func.write_byte(0);
+
+
+        func.write_opcode(Opcode::End); // end if
+
+        func.write_opcode(Opcode::End); // end function
+
+        func
+    };
+    map.insert("heap_objs_equal".to_string(), heap_objs_equal);
+
+    let get_i32_field = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I64, Numtype::I32], Some(Numtype::I32)),
+            vec!["obj".to_string(), "field_offset".to_string()]
+        );
+        func.add_local("obj_offset", Numtype::I32);
+        
+        // obj_offset = obj >> 32
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("obj");
+        func.write_opcode(Opcode::I64Const);
+        func.write_byte(0x20);
+        func.write_opcode(Opcode::I64ShrU);
+        func.write_opcode(Opcode::I32WrapI64);
+        func.write_opcode(Opcode::LocalTee);
+        func.write_var("obj_offset");
+        // read i32 at obj_offset + field_offset
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("field_offset");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::I32Load);
+        func.write_byte(0x02);  // alignment
+        func.write_byte(0x00);  // load offset
+
+        func.write_opcode(Opcode::End);
+
+        func
+    };
+    map.insert("get_i32_field".to_string(), get_i32_field);
+
+    let get_f32_field = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I64, Numtype::I32], Some(Numtype::F32)),
+            vec!["obj".to_string(), "field_offset".to_string()]
+        );
+        func.add_local("obj_offset", Numtype::I32);
+        
+        // obj_offset = obj >> 32
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("obj");
+        func.write_opcode(Opcode::I64Const);
+        func.write_byte(0x20);
+        func.write_opcode(Opcode::I64ShrU);
+        func.write_opcode(Opcode::I32WrapI64);
+        func.write_opcode(Opcode::LocalTee);
+        func.write_var("obj_offset");
+        // read i32 at obj_offset + field_offset
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("field_offset");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::F32Load);
+        func.write_byte(0x02);  // alignment
+        func.write_byte(0x00);  // load offset
+
+        func.write_opcode(Opcode::End);
+
+        func
+    };
+    map.insert("get_f32_field".to_string(), get_f32_field);
+
+    let get_i64_field = {
+        let mut func = BuiltinFunc::new(
+            FuncTypeSignature::new(vec![Numtype::I64, Numtype::I32], Some(Numtype::I64)),
+            vec!["obj".to_string(), "field_offset".to_string()]
+        );
+        func.add_local("obj_offset", Numtype::I32);
+        
+        // obj_offset = obj >> 32
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("obj");
+        func.write_opcode(Opcode::I64Const);
+        func.write_byte(0x20);
+        func.write_opcode(Opcode::I64ShrU);
+        func.write_opcode(Opcode::I32WrapI64);
+        func.write_opcode(Opcode::LocalTee);
+        func.write_var("obj_offset");
+        // read i64 at obj_offset + field_offset
+        func.write_opcode(Opcode::LocalGet);
+        func.write_var("field_offset");
+        func.write_opcode(Opcode::I32Add);
+        func.write_opcode(Opcode::I64Load);
+        func.write_byte(0x02);  // alignment
+        func.write_byte(0x00);  // load offset
+
+        func.write_opcode(Opcode::End);
+
+        func
+    };
+    map.insert("get_i64_field".to_string(), get_i64_field);
+
+    map
+});
\ No newline at end of file